@@ -1,10 +1,21 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import io
 import re
+import copy
 import os
 import sys
+import pickle
+import json
+import tempfile
 import traceback
-from typing import List  # , Optional, Union
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stdout
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, List  # , Optional, Union
 
 """
 ################################
@@ -1225,9 +1236,91 @@ int main(int argc, char * argv[])
 __all__ = [
     "PorterVanillaPyStemmer",
     # 'stem_file_wrapper',
+    "stem",
+    "dump_cache",
+    "load_cache",
     "run_comprehensive_tests",
 ]
 
+# Word tokenizer shared by every stemmer instance, compiled once at import.
+# Matches runs of Unicode letters only (no digits or underscores), so
+# stem_document() never hands punctuation or numbers to stem_word().
+# The whole word is a capturing group so re.split() keeps the words,
+# alternating with the text between them.
+# self.word_pattern = re.compile(r'\b([a-zA-Z]+)\b')  # ASCII-only variant
+_WORD_PATTERN = re.compile(r"\b([^\W\d_]+)\b", re.UNICODE)
+
+# Characters replaced with spaces by the optional document cleaner
+# (see _clean_non_alphanumeric_characters_and_normalize_spaces).
+# Note: apostrophe (') is deliberately NOT in this list
+_CLEANER_DENY_CHARACTERS = (
+    # Whitespace characters
+    "\n\t\r"
+    # Common punctuation
+    '.,!?;:"()[]{}/<>\\|'
+    # Special characters and symbols
+    "@#$%^&*+-=_~`"
+    # Additional quotation marks
+    '""«»'
+    # Common symbols
+    "§¶†‡•·"
+)
+
+# One run of denied characters and/or any whitespace, which the cleaner
+# collapses to a single space in a single pass over the text
+_CLEANER_DENY_PATTERN = re.compile(
+    "[" + re.escape(_CLEANER_DENY_CHARACTERS) + r"\s]+", re.UNICODE
+)
+
+# Byte table mapping the ASCII denied characters to spaces, for the
+# cleaner's fast path on all-ASCII text
+_CLEANER_ASCII_DENY_BYTES = "".join(
+    character for character in _CLEANER_DENY_CHARACTERS if character.isascii()
+).encode("ascii")
+_CLEANER_ASCII_TABLE = bytes.maketrans(
+    _CLEANER_ASCII_DENY_BYTES, b" " * len(_CLEANER_ASCII_DENY_BYTES)
+)
+
+# Letters that are always vowels in Porter's definition ('y' depends on
+# context). A module-level frozenset: the membership test is a single
+# hash probe with no per-call attribute lookup.
+_VOWELS = frozenset("aeiouAEIOU")
+
+# Final consonants that keep a CVC ending from counting as *o, and the
+# doubled consonants step 1b does not undouble. Both sets hold upper
+# and lower case so the tests need no .lower() call.
+_CVC_EXCLUDED_LETTERS = frozenset("wxyWXY")
+_KEPT_DOUBLE_CONSONANTS = frozenset("lszLSZ")
+
+# bytes.translate() table classifying ASCII bytes for the consonant/vowel
+# pattern: vowels -> 'v', 'y'/'Y' -> 'y' (resolved from context afterwards),
+# everything else -> 'c'
+_CV_TRANSLATION_TABLE = bytes(
+    ord("v") if chr(code) in _VOWELS else ord("y") if chr(code) in "yY" else ord("c")
+    for code in range(256)
+)
+
+# High-frequency English words that the Porter steps map to themselves in
+# both modes (e.g. 'the', 'have', 'which', and the short stopwords that
+# are kept as they are). They are returned directly, skipping the steps
+# (and, for an exact lowercase match, stem_word()'s validation and
+# cache). Words the steps would change ('was' -> 'wa', 'this' -> 'thi')
+# must not be added; test_miscellaneous_features() verifies every entry
+# against the full pipeline.
+_FIXED_POINT_WORDS = frozenset(
+    (
+        "the and that for with had not but from have which you were her all "
+        "she there would their him been when who will more out said what about "
+        "into than them can other new some could time these two then first now "
+        "such like our over man even most made after also did must through "
+        "back where much your well down should each just those how too state "
+        "good make world still own see men work long get here between both "
+        "life under never same know while last might great old year off come "
+        "against came right take three "
+        "a i of to in it be at by on or an he we me my no so do up if"
+    ).split()
+)
+
 
 class PorterVanillaPyStemmer:
     """
@@ -1242,6 +1335,7 @@ class PorterVanillaPyStemmer:
           to lowercase before stemming
         preserve_original_on_error (bool): Whether to return
           original word on errors
+        cache_size (int): Maximum number of memoized word stems
 
     Example:
         >>> stemmer = PorterVanillaPyStemmer()
@@ -1251,11 +1345,169 @@ class PorterVanillaPyStemmer:
         'The boy are run quickli!'
     """
 
+    # Every instance attribute set in __init__ and the mode setter. Slots
+    # replace the per-instance __dict__: instances are smaller and
+    # attribute reads in the stemming steps are direct slot fetches.
+    __slots__ = (
+        "to_lowercase",
+        "preserve_original_on_error",
+        "cache_size",
+        "word_pattern",
+        "_original_special_words",
+        "_special_words",
+        "_step2_trie",
+        "_step3_trie",
+        "_step4_trie",
+        "_stem_lowercase_word_cached",
+        "_mode",
+        "_mode_special_words",
+        "_step1a",
+        "_step1c",
+    )
+
+    # Step 2 rules: (m>0) suffix -> replacement
+    # Note: The C implementation uses 'bli' -> 'ble' as a DEPARTURE from the paper
+    # The paper originally specified 'abli' -> 'able'
+    # We follow the C implementation for ORIGINAL mode
+    _STEP2_RULES = (
+        ("ational", "ate"),
+        ("tional", "tion"),
+        ("enci", "ence"),
+        ("anci", "ance"),
+        ("izer", "ize"),
+        ("bli", "ble"),  # Martin Porter's DEPARTURE from paper
+        ("alli", "al"),
+        ("entli", "ent"),
+        ("eli", "e"),
+        ("ousli", "ous"),
+        ("ization", "ize"),
+        ("ation", "ate"),
+        ("ator", "ate"),
+        ("alism", "al"),
+        ("iveness", "ive"),
+        ("fulness", "ful"),
+        ("ousness", "ous"),
+        ("aliti", "al"),
+        ("iviti", "ive"),
+        ("biliti", "ble"),
+        ("logi", "log"),  # Martin Porter's DEPARTURE
+    )
+
+    # Step 3 rules: (m>0) suffix -> replacement
+    _STEP3_RULES = (
+        ("icate", "ic"),
+        ("ative", ""),
+        ("alize", "al"),
+        ("iciti", "ic"),
+        ("ical", "ic"),
+        ("ful", ""),
+        ("ness", ""),
+    )
+
+    # Step 4 rules: (m>1) suffix -> (all have empty replacement)
+    # 'ion' also needs the stem to end in 's' or 't'
+    _STEP4_SUFFIXES = (
+        "al",
+        "ance",
+        "ence",
+        "er",
+        "ic",
+        "able",
+        "ible",
+        "ant",
+        "ement",
+        "ment",
+        "ent",
+        "ion",
+        "ou",
+        "ism",
+        "ate",
+        "iti",
+        "ous",
+        "ive",
+        "ize",
+    )
+
+    # Shortest word each rule table can change. A stem with m>0 has at
+    # least 2 letters (VC) and one with m>1 at least 4 (VCVC), so a word
+    # shorter than its shortest suffix plus that stem is left unchanged
+    # by every rule of the step and the step can return immediately.
+    _STEP2_MIN_WORD_LENGTH = min(len(suffix) for suffix, _ in _STEP2_RULES) + 2
+    _STEP3_MIN_WORD_LENGTH = min(len(suffix) for suffix, _ in _STEP3_RULES) + 2
+    _STEP4_MIN_WORD_LENGTH = min(len(suffix) for suffix in _STEP4_SUFFIXES) + 4
+    # Step 5b drops one 'l' of a final 'll' from stems with m>1: the stem
+    # keeps the first 'l', so it is VCVC at least and the word has 5
+    # letters or more
+    _STEP5B_MIN_WORD_LENGTH = 5
+
+    # Stems that step 1b extends with 'e' once ED or ING is removed
+    _STEP1B_ADD_E_SUFFIXES = frozenset(("at", "bl", "iz"))
+
+    # Final letters of every suffix any step can match: 's' (1a), 'd'
+    # and 'g' (1b), 'y' (1c), 'e' (5a), 'l' (5b) and the step 2-4 rule
+    # tables. A word ending in any other letter matches no step at all,
+    # and since steps only act on a matching suffix it is its own stem.
+    _SUFFIX_FINAL_LETTERS = frozenset("sdgyel").union(
+        (suffix[-1] for suffix, _ in _STEP2_RULES),
+        (suffix[-1] for suffix, _ in _STEP3_RULES),
+        (suffix[-1] for suffix in _STEP4_SUFFIXES),
+    )
+
+    # Stem conditions of the step 2, 3 and 4 rules, stored as small
+    # integer tags in the suffix tries and tested by _apply_suffix_rule
+    _CONDITION_M_GT_0 = 0  # (m>0), every step 2 and 3 rule
+    _CONDITION_M_GT_1 = 1  # (m>1), every step 4 rule but 'ion'
+    _CONDITION_M_GT_1_S_OR_T = 2  # (m>1 and (*S or *T)), step 4 'ion'
+
+    # Size hint (in characters) passed to readlines() by stem_file_lines():
+    # lines are read in batches of about 1 MB instead of one at a time
+    _READ_SIZE_HINT = 1 << 20
+    # Characters of stemmed output stem_file_wrapper() gathers before one
+    # write call (and, for stdout, instead of a flush after every line)
+    _WRITE_BATCH_SIZE = 1 << 16
+
+    # Define special words for ORIGINAL mode
+    # These are only words that fundamentally break the algorithm
+    _ORIGINAL_SPECIAL_WORDS = {
+        "sky": "sky",  # Doesn't follow normal rules
+        "skies": "sky",  # Irregular plural
+        "news": "news",  # Always singular
+        "innings": "inning",  # Sports term
+        "outing": "outing",  # Would become 'out' otherwise
+        "canning": "canning",  # Preserves meaning
+        "howe": "howe",  # Proper noun
+        "proceed": "proceed",  # Preserve meaning
+        "exceed": "exceed",  # Preserve meaning
+        "succeed": "succeed",  # Preserve meaning
+    }
+
+    # Define all special words (including NLTK extensions)
+    # Used when mode == "NLTK_EXTENSIONS"
+    _SPECIAL_WORDS = {
+        "sky": "sky",
+        "skies": "sky",
+        "dies": "die",  # NLTK-style extension: prevent 'dies' -> 'di'
+        "ties": "tie",  # NLTK-style extension: prevent 'ties' -> 'ti'
+        "lies": "lie",  # NLTK-style extension: prevent 'lies' -> 'li'
+        "dying": "die",
+        "lying": "lie",
+        "tying": "tie",
+        "news": "news",
+        "innings": "inning",
+        "outing": "outing",
+        "canning": "canning",
+        "howe": "howe",
+        "proceed": "proceed",
+        "exceed": "exceed",
+        "succeed": "succeed",
+    }
+
     def __init__(
         self,
         to_lowercase: bool = True,
         preserve_original_on_error: bool = True,
         mode: str = "ORIGINAL",
+        cache_size: int = 50000,
     ):
         """
         Initialize the Porter Stemmer.
@@ -1270,62 +1522,282 @@ class PorterVanillaPyStemmer:
             mode (str): Either "ORIGINAL" for standard Porter algorithm or
                     "NLTK_EXTENSIONS" to include NLTK's modifications.
                     Default is "ORIGINAL".
+            cache_size (int): Maximum number of distinct lowercase words
+                    whose stems are memoized (least recently used are
+                    evicted). None means unbounded, 0 disables caching.
+                    Default is 50000.
         """
         # Configuration options
         self.to_lowercase = to_lowercase
         self.preserve_original_on_error = preserve_original_on_error
+        self.cache_size = cache_size
+
+        # Regex pattern for document processing: matches words (sequences
+        # of Unicode letters). Compiled once at import; instances share it
+        # unless one is given its own pattern.
+        self.word_pattern = _WORD_PATTERN
+
+        # Per-instance copies of the special-word tables, so adjusting
+        # one stemmer's exceptions does not affect other instances
+        # (set on the slots: the properties rebind the mode, not set yet)
+        self._original_special_words = dict(self._ORIGINAL_SPECIAL_WORDS)
+        self._special_words = dict(self._SPECIAL_WORDS)
+
+        # Reversed-suffix tries for the step 2, 3 and 4 rule tables, so
+        # each step finds its longest matching suffix in a single
+        # right-to-left walk instead of one endswith() call per rule.
+        # They depend only on the class-level rule tables, so the first
+        # instance builds them and later instances share them (read-only).
+        cls = type(self)
+        if "_suffix_tries" not in cls.__dict__:
+            cls._suffix_tries = self._build_step_tries()
+        self._step2_trie, self._step3_trie, self._step4_trie = cls._suffix_tries
+
+        # Memoize the lowercase stemming pipeline for this instance.
+        # Word frequencies in natural text are Zipfian, so a small
+        # vocabulary dominates and most calls become a dict lookup.
+        # Case preservation is applied after the lookup, so one entry
+        # serves every casing of the same word.
+        self._stem_lowercase_word_cached = lru_cache(maxsize=cache_size)(
+            self._stem_lowercase_word
+        )
+
+        # Set last: the mode setter resolves mode-specific tables and
+        # clears the cache, so both must already exist
         self.mode = mode
 
-        # Define vowels for the algorithm
-        self.vowels = set("aeiouAEIOU")
-
-        # Compile regex patterns for document processing
-        # This pattern matches words (sequences of alphabetic characters)
-        # self.word_pattern = re.compile(r'\b[a-zA-Z]+\b')
-
-        # For production use, support Unicode: matches only Unicode letters
-        self.word_pattern = re.compile(r"\b[^\W\d_]+\b", re.UNICODE)
-
-        # Define special words for ORIGINAL mode
-        # These are only words that fundamentally break the algorithm
-        self.original_special_words = {
-            "sky": "sky",  # Doesn't follow normal rules
-            "skies": "sky",  # Irregular plural
-            "news": "news",  # Always singular
-            "innings": "inning",  # Sports term
-            "outing": "outing",  # Would become 'out' otherwise
-            "canning": "canning",  # Preserves meaning
-            "howe": "howe",  # Proper noun
-            "proceed": "proceed",  # Preserve meaning
-            "exceed": "exceed",  # Preserve meaning
-            "succeed": "succeed",  # Preserve meaning
-        }
+    @property
+    def mode(self) -> str:
+        """The stemming mode: "ORIGINAL" or "NLTK_EXTENSIONS"."""
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode: str):
+        """
+        Set the stemming mode and resolve what depends on it.
+
+        The special-word table and the step 1a and 1c variants for the
+        mode are bound here once, so the per-word path does a single
+        dict lookup and direct calls instead of branching on the mode.
+        Stems memoized under the previous mode are discarded.
+
+        Args:
+            mode (str): "ORIGINAL" or "NLTK_EXTENSIONS".
+        """
+        self._mode = mode
+
+        if mode == "NLTK_EXTENSIONS":
+            # In NLTK mode, use all special words
+            self._mode_special_words = self.special_words
+            self._step1a = self._step1a_nltk_extensions
+            self._step1c = self._step1c_nltk_extensions
+        else:
+            # In ORIGINAL mode, only use limited special words
+            self._mode_special_words = self.original_special_words
+            self._step1a = self._step1a_original
+            self._step1c = self._step1c_original
+
+        self.cache_clear()
+
+    @property
+    def original_special_words(self) -> dict:
+        """
+        The special-word table used in ORIGINAL mode.
+
+        Assigning a new table takes effect at once. After editing the
+        table in place, call cache_clear() so stems memoized from the
+        old entries are discarded.
+        """
+        return self._original_special_words
+
+    @original_special_words.setter
+    def original_special_words(self, special_words: dict):
+        self._original_special_words = special_words
+        # Re-run the mode setter to rebind the table and clear the cache
+        self.mode = self._mode
+
+    @property
+    def special_words(self) -> dict:
+        """
+        The special-word table used in NLTK_EXTENSIONS mode.
+
+        Assigning a new table takes effect at once. After editing the
+        table in place, call cache_clear() so stems memoized from the
+        old entries are discarded.
+        """
+        return self._special_words
+
+    @special_words.setter
+    def special_words(self, special_words: dict):
+        self._special_words = special_words
+        # Re-run the mode setter to rebind the table and clear the cache
+        self.mode = self._mode
 
-        # Define all special words (including NLTK extensions)
-        # Used when mode == "NLTK_EXTENSIONS"
-        self.special_words = {
-            "sky": "sky",
-            "skies": "sky",
-            "dies": "die",  # NLTK-style extension: prevent 'dies' -> 'di'
-            "ties": "tie",  # NLTK-style extension: prevent 'ties' -> 'ti'
-            "lies": "lie",  # NLTK-style extension: prevent 'lies' -> 'li'
-            "dying": "die",
-            "lying": "lie",
-            "tying": "tie",
-            "news": "news",
-            "innings": "inning",
-            "outing": "outing",
-            "canning": "canning",
-            "howe": "howe",
-            "proceed": "proceed",
-            "exceed": "exceed",
-            "succeed": "succeed",
+    def __getstate__(self) -> dict:
+        """
+        Return the settings and special-word tables that define this stemmer.
+
+        The memoization cache wraps a bound method of this instance, so it
+        cannot be pickled and must not be shared with a copy; it is left
+        out, along with the tables derived from the mode and the rules.
+        """
+        return {
+            "to_lowercase": self.to_lowercase,
+            "preserve_original_on_error": self.preserve_original_on_error,
+            "mode": self._mode,
+            "cache_size": self.cache_size,
+            "word_pattern": self.word_pattern,
+            "original_special_words": self.original_special_words,
+            "special_words": self.special_words,
         }
 
+    def __setstate__(self, state: dict):
+        """
+        Rebuild a stemmer from __getstate__(), with its own empty cache.
+        """
+        self.__init__(
+            state["to_lowercase"],
+            state["preserve_original_on_error"],
+            state["mode"],
+            state["cache_size"],
+        )
+        self.word_pattern = state["word_pattern"]
+        # The table setters rebind the mode's table and clear the cache
+        self.original_special_words = state["original_special_words"]
+        self.special_words = state["special_words"]
+
+    def __copy__(self):
+        """Return a shallow copy sharing the special-word tables."""
+        copied = type(self).__new__(type(self))
+        copied.__setstate__(self.__getstate__())
+        return copied
+
+    def __deepcopy__(self, memo):
+        """Return a deep copy with its own special-word tables."""
+        copied = type(self).__new__(type(self))
+        memo[id(self)] = copied
+        copied.__setstate__(copy.deepcopy(self.__getstate__(), memo))
+        return copied
+
+    def _build_step_tries(self) -> tuple:
+        """
+        Build the reversed-suffix tries of the step 2, 3 and 4 rule tables.
+
+        The root of each trie is keyed on the last character of the
+        suffix, like the switch on the final letter in the C version.
+
+        Returns:
+            tuple: The (step2_trie, step3_trie, step4_trie) tries.
+        """
+        step2_trie = self._build_suffix_trie(
+            (suffix, replacement, self._CONDITION_M_GT_0)
+            for suffix, replacement in self._STEP2_RULES
+        )
+        step3_trie = self._build_suffix_trie(
+            (suffix, replacement, self._CONDITION_M_GT_0)
+            for suffix, replacement in self._STEP3_RULES
+        )
+        step4_trie = self._build_suffix_trie(
+            (
+                suffix,
+                "",
+                (
+                    self._CONDITION_M_GT_1_S_OR_T
+                    if suffix == "ion"
+                    else self._CONDITION_M_GT_1
+                ),
+            )
+            for suffix in self._STEP4_SUFFIXES
+        )
+        return step2_trie, step3_trie, step4_trie
+
+    def _build_suffix_trie(self, rules) -> dict:
+        """
+        Build a reversed-suffix trie from (suffix, replacement, condition)
+        rules.
+
+        Each node is a dict keyed on the next character from the end of
+        the suffix. A node where a suffix ends stores, under the key None,
+        a (suffix_length, replacement, replacement_pattern, condition)
+        tuple, where replacement_pattern is the consonant/vowel pattern of
+        the replacement text (replacements contain no 'y', so it does not
+        depend on the stem) and condition is one of the _CONDITION_* tags.
+
+        Args:
+            rules: Iterable of (suffix, replacement, condition) triples.
+
+        Returns:
+            dict: The root node of the trie.
+
+        Example:
+            ('ation', 'ate', 0) is stored under root['n']['o']['i']['t']['a']
+        """
+        root = {}
+        for suffix, replacement, condition in rules:
+            node = root
+            for character in reversed(suffix):
+                node = node.setdefault(character, {})
+            node[None] = (
+                len(suffix),
+                replacement,
+                self._consonant_vowel_pattern(replacement),
+                condition,
+            )
+        return root
+
+    def _longest_suffix_match(self, word: str, trie: dict):
+        """
+        Find the longest suffix of word stored in a reversed-suffix trie.
+
+        Walks word from its last character towards the front, following
+        the trie until no child matches, remembering the deepest node
+        where a suffix ends.
+
+        Args:
+            word (str): The word to match.
+            trie (dict): A trie built by _build_suffix_trie().
+
+        Returns:
+            tuple or None: The (suffix_length, replacement,
+              replacement_pattern, condition) entry of the longest
+              matching suffix, or None if no suffix matches.
+        """
+        node = trie
+        match = None
+        for character in reversed(word):
+            node = node.get(character)
+            if node is None:
+                break
+            match = node.get(None, match)
+        return match
+
+    def cache_info(self):
+        """
+        Return statistics for this stemmer's memoization cache.
+
+        Returns:
+            functools._CacheInfo: Named tuple of hits, misses,
+              maxsize and currsize.
+        """
+        return self._stem_lowercase_word_cached.cache_info()
+
+    def cache_clear(self):
+        """
+        Discard all memoized stems held by this stemmer.
+
+        Setting the mode or assigning a special-word table does this
+        automatically; call it after editing a table in place.
+        """
+        self._stem_lowercase_word_cached.cache_clear()
+
     def stem_word(self, word: str) -> str:
         """
         Stem a single word using the Porter algorithm.
 
+        A word containing non-alphabetic characters ("don't", "HELLO!")
+        is not stemmed: it is returned as it is, lowercased when
+        to_lowercase is set.
+
         Args:
             word (str): The word to stem.
             Should contain only alphabetic characters.
@@ -1342,6 +1814,16 @@ class PorterVanillaPyStemmer:
             >>> stemmer.stem_word("running")
             'run'
         """
+        # Special words and fixed points are stored lowercase, so an exact
+        # hit needs no validation, lowercasing, cache lookup or case
+        # handling (a lowercase fixed point is its own stem either way)
+        if isinstance(word, str):
+            special_stem = self._mode_special_words.get(word)
+            if special_stem is not None:
+                return special_stem
+            if word in _FIXED_POINT_WORDS:
+                return word
+
         # Input validation
         if word is None:
             raise ValueError("Word cannot be None")
@@ -1350,50 +1832,27 @@ class PorterVanillaPyStemmer:
         if not word:
             raise ValueError("Word cannot be empty")
 
+        # Words of one or two letters are never changed by the steps, so
+        # they skip the cache too (the case-preserving shortcut is limited
+        # to ASCII letters, whose lowercase form has the same length)
+        if len(word) < 3:
+            if self.to_lowercase:
+                return word.lower()
+            if word.isascii() and word.isalpha():
+                return word
+
+        # The Porter rules are defined on letters only, so any other
+        # token is passed through (checked before lowercasing, which can
+        # add non-letters: 'İ'.lower() is 'i' plus a combining dot)
+        if not word.isalpha():
+            return word.lower() if self.to_lowercase else word
+
         # Store original word for error handling and case preservation
         original_word = word
 
         try:
-            # Handle special cases based on mode
-            word_lower = word.lower()
-
-            # Check special words based on mode
-            if self.mode == "NLTK_EXTENSIONS":
-                # In NLTK mode, use all special words
-                if word_lower in self.special_words:
-                    result = self.special_words[word_lower]
-                    # Preserve case if needed
-                    if not self.to_lowercase:
-                        result = self._apply_case_pattern(original_word, result)
-                    return result
-            else:
-                # In ORIGINAL mode, only use limited special words
-                if word_lower in self.original_special_words:
-                    result = self.original_special_words[word_lower]
-                    # Preserve case if needed
-                    if not self.to_lowercase:
-                        result = self._apply_case_pattern(original_word, result)
-                    return result
-
-            # Apply lowercase for processing
-            word = word_lower
-
-            # Skip very short words (length 1 or 2)
-            if len(word) <= 2:
-                # Apply case pattern if not lowercasing
-                if not self.to_lowercase:
-                    return self._apply_case_pattern(original_word, word)
-                return word
-
-            # Apply Porter algorithm steps in sequence
-            word = self._step1a(word)
-            word = self._step1b(word)
-            word = self._step1c(word)
-            word = self._step2(word)
-            word = self._step3(word)
-            word = self._step4(word)
-            word = self._step5a(word)
-            word = self._step5b(word)
+            # Stem the lowercase form (memoized across calls)
+            word = self._stem_lowercase_word_cached(word.lower())
 
             # Apply case pattern if needed
             if not self.to_lowercase:
@@ -1410,6 +1869,75 @@ class PorterVanillaPyStemmer:
                     f"Error stemming word '{original_word}': {str(e)}"
                 ) from e
 
+    def _stem_lowercase_word(self, word: str) -> str:
+        """
+        Run the special-word lookup and Porter steps on a lowercase word.
+
+        This is the uncached core of stem_word(). It is wrapped by an
+        lru_cache in __init__, so it must depend only on the word and
+        the stemmer mode, never on case settings.
+
+        Args:
+        word (str): The lowercase word to stem. Must not be empty.
+
+        Returns:
+        str: The lowercase stem.
+        """
+        # Check special words for the mode (table bound by the mode setter)
+        special_stem = self._mode_special_words.get(word)
+        if special_stem is not None:
+            return special_stem
+
+        # Skip very short words (length 1 or 2) and common words known
+        # to be fixed points of the algorithm
+        if len(word) <= 2 or word in _FIXED_POINT_WORDS:
+            return word
+
+        # The Porter rules are defined on letters only. This is the one
+        # place the alphabet is checked: the private helpers below trust
+        # their input. stem_word() passes non-alphabetic tokens through
+        # before the cache, so only a word whose lowercase form gained a
+        # non-letter ('İstanbul') gets here, and it is kept unchanged.
+        if not word.isalpha():
+            return word
+
+        # Words whose last letter ends no Porter suffix ('dog', 'run')
+        # skip the pattern and all the steps
+        if word[-1] not in self._SUFFIX_FINAL_LETTERS:
+            return word
+
+        # Classify the word once and thread the consonant/vowel pattern
+        # through the steps; each step truncates or extends it alongside
+        # the word instead of reclassifying stems from scratch.
+        pattern = self._consonant_vowel_pattern(word)
+
+        # Apply Porter algorithm steps in sequence, skipping any step
+        # whose suffixes cannot match the current last letter (the roots
+        # of the step 2-4 tries are exactly their suffixes' last letters).
+        # No step ever empties the word, so word[-1] always exists.
+        if word[-1] == "s":
+            word, pattern = self._step1a(word, pattern)
+        if word[-1] in ("d", "g"):
+            word, pattern = self._step1b(word, pattern)
+        if word[-1] == "y":
+            word, pattern = self._step1c(word, pattern)
+        if word[-1] in self._step2_trie:
+            word, pattern = self._step2(word, pattern)
+        if word[-1] in self._step3_trie:
+            word, pattern = self._step3(word, pattern)
+        if word[-1] in self._step4_trie:
+            word, pattern = self._step4(word, pattern)
+        if word[-1] == "e":
+            word, pattern = self._step5a(word, pattern)
+        if word[-1] == "l":
+            word, pattern = self._step5b(word, pattern)
+
+        # Intern the stem: the many surface forms Porter collapses onto one
+        # stem ('connect', 'connected', 'connecting') then share a single
+        # string object, in the cache and in whatever the caller builds
+        # from the results. This runs once per cache miss.
+        return sys.intern(word)
+
     # # alternative 1:
     # def _clean_non_alphanumeric_characters_and_normalize_spaces_with_apostrophe_handling(
     #     self,
@@ -1679,38 +2207,25 @@ class PorterVanillaPyStemmer:
             'UTF 8 café résumé naïve'
 
         Implementation Notes:
-            - Uses character replacement for efficiency
+            - All-ASCII text is cleaned with bytes.translate() and
+              split()/join(), both C-level passes over 1-byte characters
+            - Other text uses one precompiled regex substitution
+              (_CLEANER_DENY_PATTERN) that replaces each run of denied
+              characters and whitespace with a single space
             - Preserves apostrophes to maintain contractions and possessives
             - Preserves Unicode letters to support international text
             - The deny-list approach is more maintainable than allow-list for Unicode
         """
-        # Define characters to replace with spaces
-        # Note: We're NOT including apostrophe (') in this list
-        characters_to_remove = (
-            # Whitespace characters
-            "\n\t\r"
-            # Common punctuation
-            '.,!?;:"()[]{}/<>\\|'
-            # Special characters and symbols
-            "@#$%^&*+-=_~`"
-            # Additional quotation marks
-            '""«»'
-            # Common symbols
-            "§¶†‡•·"
-        )
+        # All-ASCII text (the common case): map denied characters to
+        # spaces with one bytes.translate() over a 256-entry table, then
+        # split()/join() collapses whitespace runs and trims the ends
+        if text.isascii():
+            translated = text.encode("ascii").translate(_CLEANER_ASCII_TABLE)
+            return " ".join(translated.decode("ascii").split())
 
-        # Create translation table
-        # This maps each character to remove to a space
-        translation_table = str.maketrans(
-            characters_to_remove, " " * len(characters_to_remove)
-        )
-
-        # Apply the translation
-        text_with_punctuation_replaced = text.translate(translation_table)
-
-        # Normalize multiple spaces to single space
-        # This regex replaces any sequence of whitespace with a single space
-        normalized_text = re.sub(r"\s+", " ", text_with_punctuation_replaced)
+        # Replace every run of denied characters and whitespace with a
+        # single space (see _CLEANER_DENY_CHARACTERS), in one pass
+        normalized_text = _CLEANER_DENY_PATTERN.sub(" ", text)
 
         # Remove leading/trailing spaces and return
         cleaned_and_trimmed_text = normalized_text.strip()
@@ -1785,21 +2300,135 @@ class PorterVanillaPyStemmer:
             if not text:
                 return text
 
-        # Process the document by replacing each word with its stemmed version
-        def replace_word(match):
-            """Replace a matched word with its stemmed version."""
-            word = match.group(0)
+        # Split the document into alternating [text, word, text, ...]
+        # pieces, so the words are the odd-indexed pieces.
+        pieces = self._split_words(text)
+        words = pieces[1::2]
+
+        # Each distinct word (exact casing) is stemmed once per document;
+        # repeats, which dominate natural text, reuse its stem without
+        # re-entering stem_word() and its case handling.
+        document_stems = {}
+        for word in set(words):
             try:
-                return self.stem_word(word)
+                document_stems[word] = self.stem_word(word)
             except Exception:
-                # If stemming fails, return original word
-                return word
+                # If stemming fails, keep the original word
+                document_stems[word] = word
 
-        # Use regex to find and replace all words
-        stemmed_text = self.word_pattern.sub(replace_word, text)
+        # Splice the stems back between the untouched text pieces
+        pieces[1::2] = [document_stems[word] for word in words]
+        stemmed_text = "".join(pieces)
 
         return stemmed_text
 
+    def _split_words(self, text: str) -> List[str]:
+        """
+        Split text into alternating [text, word, text, ...] pieces.
+
+        The shared _WORD_PATTERN captures the whole word in its one group,
+        so re.split() does this in one C-level pass. Any other word_pattern
+        may have no group, several groups, or a group narrower than the
+        match, so its matches are collected with finditer() instead.
+
+        Args:
+            text (str): The text to split.
+
+        Returns:
+            List[str]: The pieces; the words are the odd-indexed ones.
+        """
+        if self.word_pattern is _WORD_PATTERN:
+            return _WORD_PATTERN.split(text)
+
+        pieces = []
+        position = 0
+        for match in self.word_pattern.finditer(text):
+            pieces.append(text[position : match.start()])
+            pieces.append(match.group(0))
+            position = match.end()
+        pieces.append(text[position:])
+        return pieces
+
+    def stem_document_batch(
+        self,
+        documents: List[str],
+        clean_non_alphanumeric: bool = False,
+    ) -> List[str]:
+        """
+        Stem a list of documents with one tokenization pass over all of them.
+
+        Gives the same result as [self.stem_document(text, clean_non_alphanumeric)
+        for text in documents], but the (cleaned) documents are joined with
+        a NUL separator, split into words with a single regex pass, and
+        each distinct word is stemmed once for the whole batch. Best for
+        many short documents, where per-call overhead dominates. With a
+        custom word_pattern, the documents are stemmed one by one.
+
+        Args:
+            documents (List[str]): The document texts to process.
+            clean_non_alphanumeric (bool): As in stem_document(), applied
+                to each document. Default is False.
+
+        Returns:
+            List[str]: The stemmed documents, in the same order.
+
+        Raises:
+            TypeError: If documents is not a list or holds a non-string
+                (the first offending index is reported).
+            ValueError: If documents is None.
+
+        Example:
+            >>> stemmer = PorterVanillaPyStemmer()
+            >>> stemmer.stem_document_batch(["The dogs ran", "Flies flying"])
+            ['the dog ran', 'fli fly']
+        """
+        # Input validation
+        if documents is None:
+            raise ValueError("Documents cannot be None")
+        if not isinstance(documents, list):
+            raise TypeError(
+                f"Documents must be a list, got {type(documents).__name__}"
+            )
+        for i, text in enumerate(documents):
+            if not isinstance(text, str):
+                raise TypeError(
+                    f"Document at index {i} must be a string, "
+                    f"got {type(text).__name__}"
+                )
+
+        if not documents:
+            return []
+
+        if clean_non_alphanumeric:
+            clean = self._clean_non_alphanumeric_characters_and_normalize_spaces
+            documents = [clean(text) for text in documents]
+
+        # NUL never occurs inside a word of the shared _WORD_PATTERN, so it
+        # marks document boundaries. A custom word_pattern may match it,
+        # and a batch that already contains one cannot be split back, so
+        # either is stemmed document by document.
+        if self.word_pattern is not _WORD_PATTERN:
+            return [self.stem_document(text) for text in documents]
+        joined = "\0".join(documents)
+        if joined.count("\0") != len(documents) - 1:
+            return [self.stem_document(text) for text in documents]
+
+        # The same split, per-distinct-word stemming and splice as
+        # stem_document(), over the whole batch at once
+        pieces = self._split_words(joined)
+        words = pieces[1::2]
+
+        batch_stems = {}
+        for word in set(words):
+            try:
+                batch_stems[word] = self.stem_word(word)
+            except Exception:
+                # If stemming fails, keep the original word
+                batch_stems[word] = word
+
+        pieces[1::2] = [batch_stems[word] for word in words]
+        return "".join(pieces).split("\0")
+
     def stem_tokens(self, tokens: List[str]) -> List[str]:
         """
         Stem a list of pre-tokenized words.
@@ -1825,7 +2454,10 @@ class PorterVanillaPyStemmer:
         if not isinstance(tokens, list):
             raise TypeError(f"Tokens must be a list, got {type(tokens).__name__}")
 
-        # Process each token
+        # Process each token. Each distinct token (exact casing) is stemmed
+        # once per call; repeats are served from this memo without
+        # re-entering stem_word() and its case handling.
+        token_stems = {}
         stemmed_tokens = []
         for i, token in enumerate(tokens):
             if not isinstance(token, str):
@@ -1833,18 +2465,194 @@ class PorterVanillaPyStemmer:
                     f"Token at index {i} must be a string, got {type(token).__name__}"
                 )
 
+            stemmed_token = token_stems.get(token)
+            if stemmed_token is None:
+                try:
+                    stemmed_token = self.stem_word(token)
+                except Exception as e:
+                    if self.preserve_original_on_error:
+                        stemmed_token = token
+                    else:
+                        raise RuntimeError(
+                            f"Error stemming token at index {i}: {str(e)}"
+                        ) from e
+                token_stems[token] = stemmed_token
+            stemmed_tokens.append(stemmed_token)
+
+        return stemmed_tokens
+
+    def stem_tokens_batch(self, tokens: List[str]) -> List[str]:
+        """
+        Stem a list of pre-tokenized words, stemming each distinct token once.
+
+        Gives the same result as stem_tokens(), but validates the whole
+        list up front, stems the set of distinct tokens, and builds the
+        output with a single lookup per token. Best for large batches
+        with many repeated tokens.
+
+        Args:
+        tokens (List[str]): List of words to stem.
+
+        Returns:
+        List[str]: List of stemmed words in the same order.
+
+        Raises:
+        TypeError: If tokens is not a list or contains non-string elements
+                   (the first offending index is reported).
+        ValueError: If tokens is None.
+        RuntimeError: If a token fails to stem and
+                      preserve_original_on_error is False.
+
+        Example:
+        >>> stemmer = PorterVanillaPyStemmer()
+        >>> stemmer.stem_tokens_batch(['running', 'flies', 'running'])
+        ['run', 'fli', 'run']
+        """
+        # Input validation
+        if tokens is None:
+            raise ValueError("Tokens cannot be None")
+        if not isinstance(tokens, list):
+            raise TypeError(f"Tokens must be a list, got {type(tokens).__name__}")
+        if not all(isinstance(token, str) for token in tokens):
+            for i, token in enumerate(tokens):
+                if not isinstance(token, str):
+                    raise TypeError(
+                        f"Token at index {i} must be a string, "
+                        f"got {type(token).__name__}"
+                    )
+
+        # Stem each distinct token (exact casing) once, in order of first
+        # appearance, so the first failing token is the first by index
+        token_stems = {}
+        for token in dict.fromkeys(tokens):
             try:
-                stemmed_token = self.stem_word(token)
-                stemmed_tokens.append(stemmed_token)
+                token_stems[token] = self.stem_word(token)
             except Exception as e:
                 if self.preserve_original_on_error:
-                    stemmed_tokens.append(token)
+                    token_stems[token] = token
                 else:
                     raise RuntimeError(
-                        f"Error stemming token at index {i}: {str(e)}"
+                        f"Error stemming token at index {tokens.index(token)}: "
+                        f"{str(e)}"
                     ) from e
 
-        return stemmed_tokens
+        return [token_stems[token] for token in tokens]
+
+    def stem_tokens_parallel(
+        self, tokens: List[str], workers=None, chunk_size=1024
+    ) -> List[str]:
+        """
+        Stem a list of pre-tokenized words in worker processes.
+
+        Gives the same result as stem_tokens_batch(): the distinct tokens
+        are split into chunks of chunk_size, each chunk is stemmed by
+        _stem_tokens_in_worker() in a ProcessPoolExecutor, and the output
+        is rebuilt with a single lookup per token. Worker processes stem
+        with a copy of this stemmer, customizations included (see
+        _worker_settings()). Token lists with no more than one chunk
+        of distinct tokens are stemmed in this process, where starting a
+        pool would cost more than it saves.
+
+        Args:
+        tokens (List[str]): List of words to stem.
+        workers (int, optional): Number of worker processes. Default is
+                                None (os.cpu_count()); 1 or less stems in
+                                this process.
+        chunk_size (int): Number of distinct tokens sent to a worker at
+                         a time. Default is 1024.
+
+        Returns:
+        List[str]: List of stemmed words in the same order.
+
+        Raises:
+        TypeError, ValueError, RuntimeError: As stem_tokens_batch().
+        BrokenProcessPool: If a worker process dies.
+
+        Example:
+        >>> stemmer = PorterVanillaPyStemmer()
+        >>> stemmer.stem_tokens_parallel(['running', 'flies', 'running'])
+        ['run', 'fli', 'run']
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        # stem_tokens_batch() validates the input and reports the first
+        # invalid index; it also handles lists too small for a pool
+        if (
+            workers <= 1
+            or not isinstance(tokens, list)
+            or not all(isinstance(token, str) for token in tokens)
+        ):
+            return self.stem_tokens_batch(tokens)
+        unique_tokens = list(set(tokens))
+        if len(unique_tokens) <= chunk_size:
+            return self.stem_tokens_batch(tokens)
+
+        settings = self._worker_settings()
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunk_futures = [
+                    executor.submit(
+                        _stem_tokens_in_worker,
+                        settings,
+                        unique_tokens[start : start + chunk_size],
+                    )
+                    for start in range(0, len(unique_tokens), chunk_size)
+                ]
+                stems = []
+                for chunk_future in chunk_futures:
+                    stems.extend(chunk_future.result())
+        except BrokenProcessPool:
+            # A RuntimeError subclass, but a crashed pool, not a token error
+            raise
+        except RuntimeError:
+            # A token failed with preserve_original_on_error False: redo the
+            # list here so the error names the token's index in tokens
+            return self.stem_tokens_batch(tokens)
+
+        token_stems = dict(zip(unique_tokens, stems))
+        return [token_stems[token] for token in tokens]
+
+    def stem_many(self, words: Iterable[str]) -> List[str]:
+        """
+        Stem every word of an iterable in a single pass.
+
+        Equivalent to [self.stem_word(word) for word in words], but each
+        distinct word (exact casing) is stemmed once per call: repeats,
+        which dominate natural text, are served from a local memo without
+        re-entering stem_word() and its case handling.
+
+        Args:
+        words (Iterable[str]): Words to stem; any iterable, consumed once.
+
+        Returns:
+        List[str]: The stemmed words in the same order.
+
+        Raises:
+        TypeError, ValueError: As stem_word(), for the first invalid word.
+
+        Example:
+        >>> stemmer = PorterVanillaPyStemmer()
+        >>> stemmer.stem_many(iter(['running', 'flies', 'running']))
+        ['run', 'fli', 'run']
+        """
+        # Bind everything the loop touches to locals
+        stems = {}
+        stems_get = stems.get
+        stem_word = self.stem_word
+        stemmed_words = []
+        append = stemmed_words.append
+
+        for word in words:
+            # Only strings can be memoized; anything else goes straight to
+            # stem_word(), which raises the appropriate error
+            stemmed_word = stems_get(word) if isinstance(word, str) else None
+            if stemmed_word is None:
+                stemmed_word = stem_word(word)
+                stems[word] = stemmed_word
+            append(stemmed_word)
+
+        return stemmed_words
 
     def _apply_case_pattern(self, original_word: str, stemmed_word: str) -> str:
         """
@@ -1898,12 +2706,9 @@ class PorterVanillaPyStemmer:
                 If original is mixed case, applies pattern position by position.
 
         Raises:
-        TypeError: If either argument is not a string or is None.
-                    Specific error message indicates which argument is invalid.
-        ValueError: If original_word contains any non-alphabetic characters.
-                    Error message lists the specific invalid characters found.
-        RuntimeError: If an unexpected error occurs during character processing.
-                    Includes position information for debugging.
+        ValueError: If original_word contains any non-alphabetic characters
+                    (checked only when __debug__ is set, i.e. not under
+                    python -O). Error message lists the invalid characters.
 
         Examples:
         >>> stemmer = PorterVanillaPyStemmer(to_lowercase=False)
@@ -1930,12 +2735,13 @@ class PorterVanillaPyStemmer:
         - This is a private method called by stem_word() when to_lowercase=False
         - Assumes stemmed_word is already valid output from the stemming algorithm
         - Does not modify the actual stem, only its case presentation
-        - Uses character-by-character processing for mixed case patterns
+        - Mixed case patterns are applied position by position in one
+          zip() over both words
         - Optimizes for common cases (all upper, all lower) for performance
         - Extra characters in stemmed word (beyond original length) default to lowercase
 
         Algorithm:
-        1. Validate inputs (non-None, string type, alphabetic only)
+        1. Validate input (alphabetic only; callers guarantee strings)
         2. Handle edge cases (empty strings)
         3. Check for optimization opportunities (all upper/lower)
         4. For mixed case: iterate through stemmed word positions
@@ -1943,21 +2749,9 @@ class PorterVanillaPyStemmer:
         - If position beyond original length, use lowercase
         5. Return the case-adjusted result
         """
-        # Comprehensive input validation
-        if original_word is None:
-            raise TypeError("original_word cannot be None")
-        if stemmed_word is None:
-            raise TypeError("stemmed_word cannot be None")
-
-        # Type checking for both arguments
-        if not isinstance(original_word, str):
-            raise TypeError(
-                f"original_word must be a string, got {type(original_word).__name__}"
-            )
-        if not isinstance(stemmed_word, str):
-            raise TypeError(
-                f"stemmed_word must be a string, got {type(stemmed_word).__name__}"
-            )
+        # Both arguments come from stem_word(), which has already checked
+        # that they are strings, so only the alphabet check remains (and
+        # only in debug runs: python -O strips it)
 
         # Handle empty stemmed word - nothing to apply pattern to
         if not stemmed_word:
@@ -1969,7 +2763,7 @@ class PorterVanillaPyStemmer:
 
         # Validate that original word contains only alphabetic characters
         # The Porter Stemmer is designed for pure alphabetic input
-        if not original_word.isalpha():
+        if __debug__ and not original_word.isalpha():
             non_alpha_chars = [char for char in original_word if not char.isalpha()]
             raise ValueError(
                 f"original_word contains non-alphabetic characters: {non_alpha_chars}. "
@@ -1985,41 +2779,17 @@ class PorterVanillaPyStemmer:
         if original_word.islower():
             return stemmed_word.lower()
 
-        # Handle mixed case - apply pattern character by character
-        # Build result character list for efficiency (avoid string concatenation)
-        result_characters = []
-
-        # Process each character in the stemmed word
-        for char_position, stemmed_char in enumerate(stemmed_word):
-            try:
-                # Check if we have a corresponding character in the original word
-                if char_position < len(original_word):
-                    original_char_at_position = original_word[char_position]
-
-                    # Apply the case from the corresponding position
-                    if original_char_at_position.isupper():
-                        result_characters.append(stemmed_char.upper())
-                    else:
-                        result_characters.append(stemmed_char.lower())
-                else:
-                    # Stemmed word is longer than original
-                    # Keep remaining characters lowercase by default
-                    # This handles cases where stemming produces a longer result
-                    result_characters.append(stemmed_char.lower())
-
-            except Exception as char_processing_error:
-                # Catch any unexpected errors during character processing
-                # Include position information for debugging
-                raise RuntimeError(
-                    f"Error processing character at position {char_position} "
-                    f"(original: '{original_word}', stemmed: '{stemmed_word}'): "
-                    f"{str(char_processing_error)}"
-                ) from char_processing_error
-
-        # Join the result characters into final string
-        final_result = "".join(result_characters)
-
-        return final_result
+        # Handle mixed case - copy the case of each position of the original
+        # word (zip stops at the shorter word, so no index checks), then
+        # keep any characters beyond the original's length lowercase, for
+        # stems that come out longer than the word
+        cased_head = "".join(
+            [
+                stemmed_char.upper() if original_char.isupper() else stemmed_char.lower()
+                for original_char, stemmed_char in zip(original_word, stemmed_word)
+            ]
+        )
+        return cased_head + stemmed_word[len(original_word) :].lower()
 
     def _is_consonant(self, word: str, index: int) -> bool:
         """
@@ -2055,12 +2825,6 @@ class PorterVanillaPyStemmer:
                     - 'yellow'[0] ('y') -> True (consonant at start)
                     - 'boyish'[2] ('y') -> False (vowel after vowel 'o')
 
-        Raises:
-        TypeError: If word is not a string or index is not an integer
-        ValueError: If word is None or empty
-        IndexError: If index is out of bounds for the given word
-        ValueError: If word contains non-alphabetic characters
-
         Examples:
         >>> stemmer._is_consonant('happy', 0)  # 'h'
         True
@@ -2076,83 +2840,94 @@ class PorterVanillaPyStemmer:
         - Assumes word is already lowercase (handled by stem_word())
         - The special 'y' handling is crucial for correct stemming
         """
-        # Input validation - check word parameter
-        if word is None:
-            raise ValueError("word cannot be None")
+        # No input validation: callers pass a validated, non-empty
+        # alphabetic word and an index within it (a bad index raises
+        # IndexError directly)
 
-        if not isinstance(word, str):
-            raise TypeError(f"word must be a string, got {type(word).__name__}")
+        # Get the character at the specified index
+        character_to_check = word[index]
 
-        if not word:
-            raise ValueError("word cannot be empty")
+        # Check if it's a standard vowel (a, e, i, o, u)
+        if character_to_check in _VOWELS:
+            return False  # It's a vowel, not a consonant
 
-        # Validate index parameter
-        if not isinstance(index, int):
-            raise TypeError(f"index must be an integer, got {type(index).__name__}")
-
-        # Boundary checking for index
-        if index < 0:
-            raise IndexError(f"index {index} is negative. Must be >= 0")
+        # All other letters except 'y' are consonants
+        if character_to_check != "y" and character_to_check != "Y":
+            return True
 
-        if index >= len(word):
-            raise IndexError(
-                f"index {index} is out of range for word of length {len(word)}"
-            )
+        # Special handling for 'y': a 'y' is a consonant at the start
+        # or after a vowel, and a vowel after a consonant. Along a run
+        # of consecutive 'y's the classes therefore alternate, so walk
+        # back to the start of the run (no recursion) and use the
+        # class of the run's first 'y' plus the parity of the offset.
+        run_start = index
+        while run_start > 0 and word[run_start - 1] in ("y", "Y"):
+            run_start -= 1
+
+        if run_start == 0:
+            # The run starts the word: its first 'y' is a consonant
+            # Examples: 'yellow', 'yes', 'yodel'
+            first_is_consonant = True
+        else:
+            # The letter before the run is a vowel or a consonant
+            first_is_consonant = word[run_start - 1] in _VOWELS
 
-        # Validate word contains only alphabetic characters
-        if not word.isalpha():
-            invalid_chars = [char for char in word if not char.isalpha()]
-            raise ValueError(
-                f"word contains non-alphabetic characters: {invalid_chars}"
-            )
+        offset_is_even = (index - run_start) % 2 == 0
+        return first_is_consonant == offset_is_even
 
-        try:
-            # Get the character at the specified index
-            character_to_check = word[index]
-
-            # Check if it's a standard vowel (a, e, i, o, u)
-            # Using set membership for efficiency
-            if character_to_check in self.vowels:
-                return False  # It's a vowel, not a consonant
-
-            # Special handling for 'y' - the tricky case
-            if character_to_check.lower() == "y":
-                # 'y' at the start of a word is always a consonant
-                # Examples: 'yellow', 'yes', 'yodel'
-                if index == 0:
-                    return True
-
-                # For 'y' not at the start, check the previous character
-                # If previous character is a vowel, 'y' is a consonant
-                # If previous character is a consonant, 'y' is a vowel
-                try:
-                    # Recursive call to check the previous character
-                    # Safe because we know index > 0 here
-                    previous_is_consonant = self._is_consonant(word, index - 1)
+    def _consonant_vowel_pattern(self, word: str) -> str:
+        """
+        Build the consonant/vowel pattern of a word in a single pass.
 
-                    # If previous is consonant, 'y' is vowel (return False)
-                    # If previous is vowel, 'y' is consonant (return True)
-                    return not previous_is_consonant
+        Each character maps to 'c' (consonant) or 'v' (vowel) using the same
+        rules as _is_consonant(). The class of 'y' depends only on the class
+        of the previous character, so it is resolved left to right instead
+        of being looked up recursively. ASCII words are classified with
+        bytes.translate(); other words with a per-character loop.
 
-                except Exception as recursion_error:
-                    # Handle any errors in recursive call
-                    raise RuntimeError(
-                        f"Error checking previous character for 'y' at index {index}: "
-                        f"{str(recursion_error)}"
-                    ) from recursion_error
+        Args:
+        word (str): The word to classify. Expected to contain only
+                    alphabetic characters (not checked; validated by
+                    stem_word()). An empty word gives an empty pattern.
 
-            # All other letters are consonants
-            # This includes all letters except a, e, i, o, u, and special-case y
-            return True
+        Returns:
+        str: A string of 'c'/'v' characters, one per character of word.
+                Examples:
+                    'tree' -> 'ccvv'
+                    'happy' -> 'cvccv'
+                    'boyish' -> 'cvcvcc'
+        """
+        # ASCII words: classify every letter in one C-level translate pass,
+        # then resolve each 'y' from the class before it ('cy' -> 'cv',
+        # 'vy' -> 'vc', leading 'y' -> 'c'). Each pass settles at least the
+        # first 'y' of every run, so runs like 'yyy' need a few passes.
+        if word.isascii():
+            classified = word.encode("ascii").translate(_CV_TRANSLATION_TABLE)
+            pattern = classified.decode("ascii")
+            if "y" in pattern:
+                if pattern[0] == "y":
+                    pattern = "c" + pattern[1:]
+                while "y" in pattern:
+                    pattern = pattern.replace("cy", "cv").replace("vy", "vc")
+            return pattern
+
+        # Other words: single scalar pass carrying the previous class
+        vowels = _VOWELS
+        pattern = []
+        previous_is_consonant = True
+        for char_index, character in enumerate(word):
+            if character in vowels:
+                previous_is_consonant = False
+            elif character == "y" or character == "Y":
+                # 'y' is a consonant at the start or after a vowel
+                previous_is_consonant = char_index == 0 or not previous_is_consonant
+            else:
+                previous_is_consonant = True
+            pattern.append("c" if previous_is_consonant else "v")
 
-        except Exception as unexpected_error:
-            # Catch any unexpected errors not already handled
-            raise RuntimeError(
-                f"Unexpected error checking character at index {index} in word '{word}': "
-                f"{str(unexpected_error)}"
-            ) from unexpected_error
+        return "".join(pattern)
 
-    def _measure(self, word: str) -> int:
+    def _measure(self, word: str, pattern: str = None) -> int:
         """
         Calculate the measure (m) of a word according to Porter's algorithm.
 
@@ -2186,6 +2961,10 @@ class PorterVanillaPyStemmer:
                     word or word stem being evaluated for rule application.
                     Examples: 'tree', 'trouble', 'private'
 
+        pattern (str, optional): The precomputed consonant/vowel pattern of
+                    word (see _consonant_vowel_pattern()). Passed by the
+                    Porter steps so the word is not classified again.
+
         Returns:
         int: The measure of the word (number of VC sequences). Will be >= 0.
                 Returns 0 for empty words or words with no VC sequences.
@@ -2195,12 +2974,6 @@ class PorterVanillaPyStemmer:
                     'trouble' -> 1 (pattern: CCVCCCV with one VC)
                     'private' -> 2 (pattern: CCVCVCV with two VCs)
 
-        Raises:
-        TypeError: If word is not a string
-        ValueError: If word is None
-        ValueError: If word contains non-alphabetic characters
-        RuntimeError: If an unexpected error occurs during processing
-
         Examples:
         >>> stemmer._measure('tree')
         0
@@ -2214,106 +2987,55 @@ class PorterVanillaPyStemmer:
         Implementation Notes:
         - This is a core method used by most stemming rules to check conditions
         - The measure determines if rules like "(m>0) ATIONAL -> ATE" apply
-        - Uses _is_consonant() to build the consonant/vowel pattern
+        - Counts 'vc' pairs in _consonant_vowel_pattern(), which classifies
+          the whole word in one pass instead of once per character
         - Empty word returns 0 (no VC sequences)
+        - No input validation: stem_word() validates words once up front
         """
-        # Input validation
-        if word is None:
-            raise ValueError("word cannot be None")
-
-        if not isinstance(word, str):
-            raise TypeError(f"word must be a string, got {type(word).__name__}")
-
         # Empty word has measure 0 - no vowel-consonant sequences
         if not word:
             return 0
 
-        # Validate word contains only alphabetic characters
-        if not word.isalpha():
-            invalid_chars = [char for char in word if not char.isalpha()]
-            raise ValueError(
-                f"word contains non-alphabetic characters: {invalid_chars}. "
-                f"Word must contain only alphabetic characters."
-            )
-
-        try:
-            # Build a pattern string representing consonants ('c') and vowels ('v')
-            # This makes it easy to count VC sequences
-            consonant_vowel_pattern = ""
-
-            # Analyze each character in the word
-            for char_index in range(len(word)):
-                try:
-                    # Check if character is consonant or vowel
-                    if self._is_consonant(word, char_index):
-                        consonant_vowel_pattern += "c"
-                    else:
-                        consonant_vowel_pattern += "v"
-
-                except Exception as char_error:
-                    # Handle errors from _is_consonant
-                    raise RuntimeError(
-                        f"Error analyzing character at position {char_index}: "
-                        f"{str(char_error)}"
-                    ) from char_error
-
-            # Count the number of 'vc' sequences in the pattern
-            # This is the measure value
-            vc_sequence_count = 0
-
-            # Look for each occurrence of 'vc' in the pattern
-            # We check each adjacent pair of characters
-            for pattern_index in range(len(consonant_vowel_pattern) - 1):
-                current_char = consonant_vowel_pattern[pattern_index]
-                next_char = consonant_vowel_pattern[pattern_index + 1]
-
-                # Check if we have a vowel followed by consonant
-                if current_char == "v" and next_char == "c":
-                    vc_sequence_count += 1
-
-            # Return the final measure count
-            return vc_sequence_count
+        # Each VC sequence is exactly one 'vc' pair in the pattern
+        if pattern is None:
+            pattern = self._consonant_vowel_pattern(word)
+        return pattern.count("vc")
 
-        except Exception as unexpected_error:
-            # Catch any unexpected errors not already handled
-            raise RuntimeError(
-                f"Unexpected error calculating measure for word '{word}': "
-                f"{str(unexpected_error)}"
-            ) from unexpected_error
-
-    def _contains_vowel(self, word: str) -> bool:
+    def _contains_vowel(self, word: str, pattern: str = None) -> bool:
         """
         Check if the word contains at least one vowel.
 
         Args:
         word (str): The word to check.
+        pattern (str, optional): Precomputed consonant/vowel pattern of word.
 
         Returns:
         bool: True if the word contains a vowel, False otherwise.
         """
-        for i in range(len(word)):
-            if not self._is_consonant(word, i):
-                return True
-        return False
+        if pattern is None:
+            pattern = self._consonant_vowel_pattern(word)
+        return "v" in pattern
 
-    def _ends_with_double_consonant(self, word: str) -> bool:
+    def _ends_with_double_consonant(self, word: str, pattern: str = None) -> bool:
         """
         Check if the word ends with a double consonant (e.g., 'tt', 'ss').
 
         Args:
         word (str): The word to check.
+        pattern (str, optional): Precomputed consonant/vowel pattern of word.
 
         Returns:
         bool: True if the word ends with a double consonant.
         """
-        # Need at least 2 characters
-        if len(word) < 2:
+        # Last two characters the same (so both the same class) and the
+        # last one a consonant
+        if len(word) < 2 or word[-1] != word[-2]:
             return False
+        if pattern is None:
+            pattern = self._consonant_vowel_pattern(word)
+        return pattern[-1] == "c"
 
-        # Check if last two characters are the same and both consonants
-        return word[-1] == word[-2] and self._is_consonant(word, len(word) - 1)
-
-    def _ends_cvc(self, word: str) -> bool:
+    def _ends_cvc(self, word: str, pattern: str = None) -> bool:
         """
         Check if the word ends with consonant-vowel-consonant pattern.
 
@@ -2322,33 +3044,78 @@ class PorterVanillaPyStemmer:
 
         Args:
         word (str): The word to check.
+        pattern (str, optional): Precomputed consonant/vowel pattern of word.
 
         Returns:
         bool: True if the word ends with CVC (with restrictions).
         """
-        # Need at least 3 characters
-        if len(word) < 3:
-            return False
+        # CVC needs at least 3 characters, which endswith() implies; the
+        # final consonant must not be w, x, or y
+        if pattern is None:
+            pattern = self._consonant_vowel_pattern(word)
+        return pattern.endswith("cvc") and word[-1] not in _CVC_EXCLUDED_LETTERS
 
-        # Check the pattern
-        if (
-            self._is_consonant(word, len(word) - 3)
-            and not self._is_consonant(word, len(word) - 2)
-            and self._is_consonant(word, len(word) - 1)
-        ):
+    def _measure_prefix(self, word: str, pattern: str, length: int) -> int:
+        """
+        Calculate the measure of word[:length] without slicing the word.
 
-            # Final consonant must not be w, x, or y
-            last_char = word[-1].lower()
-            return last_char not in ("w", "x", "y")
+        The 'vc' pairs of the precomputed pattern are counted in place
+        (str.count with bounds), so a rule whose condition fails allocates
+        nothing.
 
-        return False
+        Args:
+        word (str): The word whose prefix is measured.
+        pattern (str): The consonant/vowel pattern of word.
+        length (int): The length of the prefix (the candidate stem).
+
+        Returns:
+        int: The measure of word[:length].
+        """
+        return pattern.count("vc", 0, length)
+
+    def _prefix_contains_vowel(self, word: str, pattern: str, length: int) -> bool:
+        """
+        Check if word[:length] contains a vowel without slicing the word.
+
+        Args:
+        word (str): The word whose prefix is checked.
+        pattern (str): The consonant/vowel pattern of word.
+        length (int): The length of the prefix (the candidate stem).
+
+        Returns:
+        bool: True if the prefix contains a vowel, False otherwise.
+        """
+        return pattern.find("v", 0, length) != -1
+
+    def _prefix_ends_cvc(self, word: str, pattern: str, length: int) -> bool:
+        """
+        Check if word[:length] ends with CVC (*o) without slicing the word.
+
+        Args:
+        word (str): The word whose prefix is checked.
+        pattern (str): The consonant/vowel pattern of word.
+        length (int): The length of the prefix (the candidate stem).
+
+        Returns:
+        bool: True if the prefix ends with CVC whose final consonant is
+              not 'w', 'x' or 'y', False otherwise.
+        """
+        return (
+            length >= 3
+            and pattern.endswith("cvc", 0, length)
+            and word[length - 1] not in _CVC_EXCLUDED_LETTERS
+        )
 
     # original vs. NLTK mode
     # the rule should be: IES → I (unconditionally)
-    def _step1a(self, word: str) -> str:
+    def _step1a_original(self, word: str, pattern: str) -> tuple:
         """
         Apply Step 1a of the Porter algorithm: Remove plural suffixes.
 
+        This is the ORIGINAL mode variant; the mode setter binds it (or
+        _step1a_nltk_extensions()) as self._step1a, so the per-word path
+        never tests the mode.
+
         This method implements the first step of the Porter Stemming Algorithm,
         which deals with removing plural forms. The method processes words ending
         in 's' and applies specific transformation rules based on the exact suffix.
@@ -2396,11 +3163,15 @@ class PorterVanillaPyStemmer:
                     normalization was requested). Must not be None or empty
                     (these conditions should be checked by stem_word()).
 
+        pattern (str): The consonant/vowel pattern of word (see
+                    _consonant_vowel_pattern()). It is truncated alongside
+                    the word.
+
         Returns:
-        str: The word after applying Step 1a transformations. The returned
-                word will have the appropriate suffix removed or modified
-                according to the rules above. If no rules apply (word doesn't
-                end in 's'), the original word is returned unchanged.
+        tuple: (word, pattern) after applying Step 1a transformations. The
+                returned word will have the appropriate suffix removed or
+                modified according to the rules above. If no rules apply (word
+                doesn't end in 's'), the original word is returned unchanged.
 
         Examples:
         Standard mode (ORIGINAL):
@@ -2423,8 +3194,8 @@ class PorterVanillaPyStemmer:
         method called by stem_word() which handles validation
         - The method assumes the word parameter is already properly formatted
         - No exceptions are raised directly by this method
-        - The NLTK extension check is performed first to override the
-        standard IES -> I rule when applicable
+        - The NLTK extension is handled by _step1a_nltk_extensions(),
+        which overrides the standard IES -> I rule when applicable
 
         References:
         Porter, M. "An algorithm for suffix stripping."
@@ -2463,34 +3234,52 @@ class PorterVanillaPyStemmer:
         # Apply standard Porter algorithm rules in order of suffix length
         # to ensure longest matches are found first
 
-        # Rule 1: SSES -> SS (remove 'es' from words ending in 'sses')
-        if word.endswith("sses"):
-            return word[:-2]
+        # Suffixes are tested by comparing tail slices, which avoids the
+        # method-call overhead of endswith(); a slice of a shorter word is
+        # simply shorter than the literal, so no length guard is needed
+        tail = word[-3:]
 
-        # Check for NLTK extension first - this handles special cases for
-        # 4-letter words ending in 'ies' that should become 'ie' rather
-        # than 'i' for more intuitive results
-        if self.mode == "NLTK_EXTENSIONS" and word.endswith("ies") and len(word) == 4:
-            # Remove the 's' to change 'ies' to 'ie'
-            # Examples: 'dies' -> 'die', 'ties' -> 'tie'
-            return word[:-1]
+        # Every rule needs a final 's': most words leave on this one test
+        if tail[-1:] != "s":
+            return word, pattern
+
+        # Rule 1: SSES -> SS (remove 'es' from words ending in 'sses')
+        if tail == "ses" and word[-4:-3] == "s":
+            return word[:-2], pattern[:-2]
 
         # Rule 2: IES -> I (remove 'es' from words ending in 'ies')
-        elif word.endswith("ies"):
-            return word[:-2]
+        elif tail == "ies":
+            return word[:-2], pattern[:-2]
 
         # Rule 3: SS -> SS (no change for words ending in 'ss')
-        elif word.endswith("ss"):
-            return word
+        elif tail[-2:] == "ss":
+            return word, pattern
+
+        # Rule 4: S -> (remove single 's' at end; the final 's' was
+        # checked on entry)
+        return word[:-1], pattern[:-1]
+
+    def _step1a_nltk_extensions(self, word: str, pattern: str) -> tuple:
+        """
+        Apply Step 1a with the NLTK extension for 4-letter 'ies' words.
+
+        4-letter words ending in 'ies' become 'ie' rather than 'i' for
+        more intuitive results ('dies' -> 'die', 'ties' -> 'tie'); every
+        other word follows _step1a_original().
 
-        # Rule 4: S -> (remove single 's' at end)
-        elif word.endswith("s"):
-            return word[:-1]
+        Args:
+        word (str): The word to process.
+        pattern (str): The consonant/vowel pattern of word.
 
-        # No plural suffix found - return word unchanged
-        return word
+        Returns:
+        tuple: (word, pattern) after applying Step 1a.
+        """
+        if len(word) == 4 and word[-3:] == "ies":
+            # Remove the 's' to change 'ies' to 'ie'
+            return word[:-1], pattern[:-1]
+        return self._step1a_original(word, pattern)
 
-    def _step1b(self, word: str) -> str:
+    def _step1b(self, word: str, pattern: str) -> tuple:
         """
         Apply Step 1b of the Porter algorithm: Remove past tense suffixes.
 
@@ -2501,51 +3290,60 @@ class PorterVanillaPyStemmer:
 
         Args:
         word (str): The word to process.
+        pattern (str): The consonant/vowel pattern of word.
 
         Returns:
-        str: The word after applying Step 1b.
+        tuple: (word, pattern) after applying Step 1b.
         """
         # Rule: (m>0) EED -> EE
-        if word.endswith("eed"):
-            stem = word[:-3]
-            if self._measure(stem) > 0:
-                return stem + "ee"
-            return word
+        # Conditions are tested on the stem length first; the word is only
+        # sliced once a rule actually fires
+        tail = word[-3:]
+        if tail == "eed":
+            if self._measure_prefix(word, pattern, len(word) - 3) > 0:
+                # EED -> EE is just dropping the final 'd'
+                return word[:-1], pattern[:-1]
+            return word, pattern
 
         # Rules: (*v*) ED -> and (*v*) ING ->
-        flag = False
-        if word.endswith("ed"):
-            stem = word[:-2]
-            if self._contains_vowel(stem):
-                word = stem
-                flag = True
-        elif word.endswith("ing"):
-            stem = word[:-3]
-            if self._contains_vowel(stem):
-                word = stem
-                flag = True
-
-        # If ED or ING was removed, apply additional rules
-        if flag:
-            # AT -> ATE
-            if word.endswith("at"):
-                return word + "e"
-            # BL -> BLE
-            elif word.endswith("bl"):
-                return word + "e"
-            # IZ -> IZE
-            elif word.endswith("iz"):
-                return word + "e"
-            # Double consonant and not ending in L, S, or Z -> single letter
-            elif self._ends_with_double_consonant(word):
-                last_char = word[-1].lower()
-                if last_char not in ("l", "s", "z"):
-                    return word[:-1]
-            # (m=1 and *o) -> E
-            elif self._measure(word) == 1 and self._ends_cvc(word):
-                return word + "e"
-
-        return word
+        if tail[-2:] == "ed":
+            stem_length = len(word) - 2
+        elif tail == "ing":
+            stem_length = len(word) - 3
+        else:
+            return word, pattern
+        # (*v*): the _prefix_contains_vowel() test, inlined on the pattern
+        # that the rest of the step reuses, so no character is rescanned
+        if pattern.find("v", 0, stem_length) == -1:
+            return word, pattern
+        word, pattern = word[:stem_length], pattern[:stem_length]
+
+        # ED or ING was removed: apply the additional rules
+        # (the appended 'e' is always a vowel: pattern gains a 'v')
+        # AT -> ATE, BL -> BLE, IZ -> IZE
+        if word[-2:] in self._STEP1B_ADD_E_SUFFIXES:
+            return word + "e", pattern + "v"
+        # Double consonant and not ending in L, S, or Z -> single letter
+        # (the _ends_with_double_consonant() test, inlined: two equal
+        # final letters whose last pattern entry is a consonant)
+        if (
+            len(word) >= 2
+            and word[-1] == word[-2]
+            and pattern[-1] == "c"
+        ):
+            if word[-1] not in _KEPT_DOUBLE_CONSONANTS:
+                return word[:-1], pattern[:-1]
+            return word, pattern
+        # (m=1 and *o) -> E
+        # (the measure and the _ends_cvc() test, inlined on the pattern)
+        if (
+            pattern.count("vc") == 1
+            and pattern.endswith("cvc")
+            and word[-1] not in _CVC_EXCLUDED_LETTERS
+        ):
+            return word + "e", pattern + "v"
+
+        return word, pattern
 
     # def _step1c(self, word: str) -> str:
     #     """
@@ -2584,7 +3382,7 @@ class PorterVanillaPyStemmer:
 
     #     return word
 
-    def _step1c(self, word: str) -> str:
+    def _step1c_original(self, word: str, pattern: str) -> tuple:
         """
         Apply Step 1c of the Porter algorithm: Change Y to I.
 
@@ -2593,6 +3391,29 @@ class PorterVanillaPyStemmer:
         Change Y to I if the stem (part before Y) contains a vowel.
         Examples: happy -> happi, sky -> sky
 
+        The mode setter binds this method (or _step1c_nltk_extensions())
+        as self._step1c, so the per-word path never tests the mode.
+
+        Args:
+        word (str): The word to process.
+        pattern (str): The consonant/vowel pattern of word.
+
+        Returns:
+        tuple: (word, pattern) after applying Step 1c.
+        """
+        if word[-1:] != "y":
+            return word, pattern
+
+        # The replacement 'i' is always a vowel: pattern ends in 'v'
+        if self._prefix_contains_vowel(word, pattern, len(word) - 1):
+            return word[:-1] + "i", pattern[:-1] + "v"
+
+        return word, pattern
+
+    def _step1c_nltk_extensions(self, word: str, pattern: str) -> tuple:
+        """
+        Apply Step 1c with the NLTK rule: Change Y to I after a consonant.
+
         NLTK Extension Rule:
         Y -> I only if:
         1. Y is preceded by a consonant (not a vowel)
@@ -2606,118 +3427,107 @@ class PorterVanillaPyStemmer:
 
         Args:
         word (str): The word to process.
+        pattern (str): The consonant/vowel pattern of word.
 
         Returns:
-        str: The word after applying Step 1c.
+        tuple: (word, pattern) after applying Step 1c.
         """
-        if not word.endswith("y"):
-            return word
+        if word[-1:] != "y":
+            return word, pattern
 
-        stem = word[:-1]
+        # The last character of the stem must be a consonant; the
+        # replacement 'i' is always a vowel: pattern ends in 'v'
+        stem_length = len(word) - 1
+        if stem_length > 1 and pattern[stem_length - 1] == "c":
+            return word[:-1] + "i", pattern[:-1] + "v"
 
-        if self.mode == "NLTK_EXTENSIONS":
-            # NLTK rule: Y -> I only if preceded
-            # by consonant and stem length > 1
-            # This means checking if the last
-            # character of the stem is a consonant
-            if len(stem) > 1 and self._is_consonant(stem, len(stem) - 1):
-                return stem + "i"
-        else:
-            # Original Porter rule: Y -> I if stem contains any vowel
-            if self._contains_vowel(stem):
-                return stem + "i"
-
-        return word
+        return word, pattern
 
-    def _step2(self, word: str) -> str:
+    def _step2(self, word: str, pattern: str) -> tuple:
         """
         Apply Step 2 of the Porter algorithm: Remove derivational suffixes.
 
-        This step has many rules for different suffix patterns.
-        All rules require (m>0) for the stem.
+        This step has many rules for different suffix patterns
+        (see _STEP2_RULES). All rules require (m>0) for the stem.
 
         Args:
         word (str): The word to process.
+        pattern (str): The consonant/vowel pattern of word.
 
         Returns:
-        str: The word after applying Step 2.
+        tuple: (word, pattern) after applying Step 2.
         """
-        # Define suffix mappings: (suffix, replacement)
-        # Note: The C implementation uses 'bli' -> 'ble' as a DEPARTURE from the paper
-        # The paper originally specified 'abli' -> 'able'
-        # We follow the C implementation for ORIGINAL mode
-        suffix_mappings = [
-            ("ational", "ate"),
-            ("tional", "tion"),
-            ("enci", "ence"),
-            ("anci", "ance"),
-            ("izer", "ize"),
-            ("bli", "ble"),  # Martin Porter's DEPARTURE from paper
-            ("alli", "al"),
-            ("entli", "ent"),
-            ("eli", "e"),
-            ("ousli", "ous"),
-            ("ization", "ize"),
-            ("ation", "ate"),
-            ("ator", "ate"),
-            ("alism", "al"),
-            ("iveness", "ive"),
-            ("fulness", "ful"),
-            ("ousness", "ous"),
-            ("aliti", "al"),
-            ("iviti", "ive"),
-            ("biliti", "ble"),
-            ("logi", "log"),  # Martin Porter's DEPARTURE
-        ]
-
-        # Try each suffix mapping
-        for suffix, replacement in suffix_mappings:
-            if word.endswith(suffix):
-                stem = word[: -len(suffix)]
-                # Check if measure > 0
-                if self._measure(stem) > 0:
-                    return stem + replacement
-                # If measure is not > 0, don't try other suffixes
-                break
+        if len(word) < self._STEP2_MIN_WORD_LENGTH:
+            return word, pattern
 
-        return word
+        # Find the longest matching suffix (the rule that fires, since
+        # no other suffix needs to be tried once one matches)
+        return self._apply_suffix_rule(word, pattern, self._step2_trie)
 
-    def _step3(self, word: str) -> str:
+    def _step3(self, word: str, pattern: str) -> tuple:
         """
         Apply Step 3 of the Porter algorithm: Remove derivational suffixes.
 
-        All rules require (m>0) for the stem.
+        All rules (see _STEP3_RULES) require (m>0) for the stem.
 
         Args:
         word (str): The word to process.
+        pattern (str): The consonant/vowel pattern of word.
 
         Returns:
-        str: The word after applying Step 3.
+        tuple: (word, pattern) after applying Step 3.
         """
-        # Define suffix mappings: (suffix, replacement)
-        suffix_mappings = [
-            ("icate", "ic"),
-            ("ative", ""),
-            ("alize", "al"),
-            ("iciti", "ic"),
-            ("ical", "ic"),
-            ("ful", ""),
-            ("ness", ""),
-        ]
-
-        # Try each suffix mapping
-        for suffix, replacement in suffix_mappings:
-            if word.endswith(suffix):
-                stem = word[: -len(suffix)]
-                # Check if measure > 0
-                if self._measure(stem) > 0:
-                    return stem + replacement
-                # If measure is not > 0, don't try other suffixes
-                break
+        if len(word) < self._STEP3_MIN_WORD_LENGTH:
+            return word, pattern
 
-        return word
+        return self._apply_suffix_rule(word, pattern, self._step3_trie)
 
-    def _step4(self, word: str) -> str:
+    def _apply_suffix_rule(self, word: str, pattern: str, trie: dict) -> tuple:
+        """
+        Apply the suffix -> replacement rule table of Step 2, 3 or 4.
+
+        Only the longest matching suffix is considered: if its stem fails
+        the rule's condition, no shorter suffix is tried.
+
+        Args:
+        word (str): The word to process.
+        pattern (str): The consonant/vowel pattern of word.
+        trie (dict): The step's trie built by _build_suffix_trie().
+
+        Returns:
+        tuple: (word, pattern) after applying the rule, if any.
+        """
+        match = self._longest_suffix_match(word, trie)
+        if match is not None:
+            suffix_length, replacement, replacement_pattern, condition = match
+            stem_length = len(word) - suffix_length
+            # A stem with m>0 has at least 2 letters (VC) and one with m>1
+            # at least 4 (VCVC): shorter stems fail without measuring
+            if condition == self._CONDITION_M_GT_0:
+                passes = (
+                    stem_length >= 2
+                    and self._measure_prefix(word, pattern, stem_length) > 0
+                )
+            elif condition == self._CONDITION_M_GT_1:
+                passes = (
+                    stem_length >= 4
+                    and self._measure_prefix(word, pattern, stem_length) > 1
+                )
+            else:
+                passes = (
+                    stem_length >= 4
+                    and word[stem_length - 1] in ("s", "t")
+                    and self._measure_prefix(word, pattern, stem_length) > 1
+                )
+            if passes:
+                return (
+                    word[:stem_length] + replacement,
+                    pattern[:stem_length] + replacement_pattern,
+                )
+
+        return word, pattern
+
+    def _step4(self, word: str, pattern: str) -> tuple:
         """
         Apply Step 4 of the Porter algorithm: Remove residual suffixes.
 
@@ -2725,51 +3535,19 @@ class PorterVanillaPyStemmer:
 
         Args:
         word (str): The word to process.
+        pattern (str): The consonant/vowel pattern of word.
 
         Returns:
-        str: The word after applying Step 4.
+        tuple: (word, pattern) after applying Step 4.
         """
-        # Define suffixes to remove (all have empty replacement)
-        suffixes_to_remove = [
-            "al",
-            "ance",
-            "ence",
-            "er",
-            "ic",
-            "able",
-            "ible",
-            "ant",
-            "ement",
-            "ment",
-            "ent",
-            "ou",
-            "ism",
-            "ate",
-            "iti",
-            "ous",
-            "ive",
-            "ize",
-        ]
-
-        # Special case for 'ion' - requires stem to end in 's' or 't'
-        if word.endswith("ion"):
-            stem = word[:-3]
-            if len(stem) > 0 and stem[-1] in ("s", "t") and self._measure(stem) > 1:
-                return stem
-
-        # Try other suffixes
-        for suffix in suffixes_to_remove:
-            if word.endswith(suffix):
-                stem = word[: -len(suffix)]
-                # Check if measure > 1
-                if self._measure(stem) > 1:
-                    return stem
-                # If measure is not > 1, don't try other suffixes
-                break
+        # Too short for any suffix to leave a stem with m>1
+        if len(word) < self._STEP4_MIN_WORD_LENGTH:
+            return word, pattern
 
-        return word
+        # See _STEP4_SUFFIXES; 'ion' carries its extra (*S or *T) condition
+        return self._apply_suffix_rule(word, pattern, self._step4_trie)
 
-    def _step5a(self, word: str) -> str:
+    def _step5a(self, word: str, pattern: str) -> tuple:
         """
         Apply Step 5a of the Porter algorithm: Remove final 'e'.
 
@@ -2779,25 +3557,27 @@ class PorterVanillaPyStemmer:
 
         Args:
         word (str): The word to process.
+        pattern (str): The consonant/vowel pattern of word.
 
         Returns:
-        str: The word after applying Step 5a.
+        tuple: (word, pattern) after applying Step 5a.
         """
-        if word.endswith("e"):
-            stem = word[:-1]
-            measure = self._measure(stem)
+        if word[-1:] == "e":
+            measure = self._measure_prefix(word, pattern, len(word) - 1)
 
             # Rule: (m>1) E ->
             if measure > 1:
-                return stem
+                return word[:-1], pattern[:-1]
 
             # Rule: (m=1 and not *o) E ->
-            if measure == 1 and not self._ends_cvc(stem):
-                return stem
+            if measure == 1 and not self._prefix_ends_cvc(
+                word, pattern, len(word) - 1
+            ):
+                return word[:-1], pattern[:-1]
 
-        return word
+        return word, pattern
 
-    def _step5b(self, word: str) -> str:
+    def _step5b(self, word: str, pattern: str) -> tuple:
         """
         Apply Step 5b of the Porter algorithm: Remove double 'l'.
 
@@ -2806,15 +3586,24 @@ class PorterVanillaPyStemmer:
 
         Args:
         word (str): The word to process.
+        pattern (str): The consonant/vowel pattern of word.
 
         Returns:
-        str: The word after applying Step 5b.
+        tuple: (word, pattern) after applying Step 5b.
         """
-        # Check if word ends with double 'l'
-        if word.endswith("ll") and self._measure(word[:-1]) > 1:
-            return word[:-1]
+        if len(word) < self._STEP5B_MIN_WORD_LENGTH:
+            return word, pattern
 
-        return word
+        # Check if word ends with double 'l' (indexing is safe after the
+        # length guard, and compares single characters without slicing)
+        if (
+            word[-1] == "l"
+            and word[-2] == "l"
+            and self._measure_prefix(word, pattern, len(word) - 1) > 1
+        ):
+            return word[:-1], pattern[:-1]
+
+        return word, pattern
 
     def stem_file_lines(
         self,
@@ -2822,13 +3611,15 @@ class PorterVanillaPyStemmer:
         encoding="utf-8",
         errors="strict",
         clean_non_alphanumeric=False,
+        workers=None,
     ):
         """
         Generator that yields stemmed lines from a file one at a time.
 
         This method provides memory-efficient processing of large files by
         yielding one stemmed line at a time rather than loading the entire
-        file into memory.
+        file into memory. Lines are read in batches of about 1 MB
+        (_READ_SIZE_HINT) to amortize the per-line read overhead.
 
         Args:
         file_path (str): Path to the file to process. Must be a valid,
@@ -2842,6 +3633,11 @@ class PorterVanillaPyStemmer:
         clean_non_alphanumeric (bool): If True, removes punctuation and special
                                      characters before stemming each line.
                                      Default is False.
+        workers (int, optional): If greater than 1, stem batches of lines in
+                                this many worker processes (see
+                                _stem_lines_parallel()). Lines are still
+                                yielded in file order. Default is None
+                                (stem in this process).
 
         Yields:
         str: Stemmed version of each line in the file, preserving
@@ -2872,39 +3668,216 @@ class PorterVanillaPyStemmer:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        if not os.access(file_path, os.R_OK):
-            raise PermissionError(f"Cannot read file: {file_path}")
+        if not os.access(file_path, os.R_OK):
+            raise PermissionError(f"Cannot read file: {file_path}")
+
+        # Open file with specified encoding and error handling
+        try:
+            with open(
+                file_path, "r", encoding=encoding, errors=errors, buffering=8192
+            ) as file_handle:
+
+                # Spread batches of lines over worker processes if requested
+                if workers is not None and workers > 1:
+                    yield from self._stem_lines_parallel(
+                        file_handle, workers, clean_non_alphanumeric
+                    )
+                    return
+
+                # Read the file in batches of lines (bounded by
+                # _READ_SIZE_HINT, so memory stays flat) and stem each line
+                stem_document = self.stem_document
+                line_number = 0
+                while True:
+                    lines = file_handle.readlines(self._READ_SIZE_HINT)
+                    if not lines:
+                        break
+                    for line in lines:
+                        line_number += 1
+                        try:
+                            # Stem the line and yield result
+                            # stem_document preserves whitespace and punctuation
+                            yield stem_document(
+                                line, clean_non_alphanumeric=clean_non_alphanumeric
+                            )
+
+                        except Exception as e:
+                            # Wrap any stemming errors with line information
+                            raise RuntimeError(
+                                f"Error stemming line {line_number} in {file_path}: {e}"
+                            ) from e
+
+        except UnicodeDecodeError as e:
+            # Enhance error message with file information
+            raise UnicodeDecodeError(
+                e.encoding, e.object, e.start, e.end, f"{e.reason} in file: {file_path}"
+            )
+
+        except IOError as e:
+            # Re-raise with more context
+            raise IOError(f"Error reading file {file_path}: {e}") from e
+
+    def stem_file_bulk(
+        self,
+        file_path,
+        output_file,
+        encoding="utf-8",
+        errors="strict",
+        clean_non_alphanumeric=False,
+    ):
+        """
+        Stem a whole file in memory and write the result with one write call.
+
+        Produces the same text as joining the lines of stem_file_lines(),
+        but reads the file with a single read(), stems all of it at once
+        (each distinct word is stemmed once, see stem_document()) and
+        writes it back in one call. For files that fit comfortably in
+        memory, this avoids the per-line read, stem and write overhead;
+        use stem_file_lines() or stem_file_wrapper() for larger files.
+
+        Args:
+        file_path (str): Path to the file to process.
+        output_file (str): Path to write the stemmed text to. Created or
+                          overwritten.
+        encoding (str): Encoding of both files. Default is 'utf-8'.
+        errors (str): How to handle decoding errors, as in
+                     stem_file_lines(). Default is 'strict'.
+        clean_non_alphanumeric (bool): If True, each line is cleaned
+                                     before stemming, as in
+                                     stem_file_lines(). Default is False.
+
+        Returns:
+        int: The number of characters written to output_file.
+
+        Raises:
+        FileNotFoundError: If file_path doesn't exist
+        PermissionError: If lacking read or write permission
+        UnicodeDecodeError: If encoding errors occur (with errors='strict')
+
+        Example:
+        >>> stemmer = PorterVanillaPyStemmer()
+        >>> stemmer.stem_file_bulk('document.txt', 'stemmed.txt')
+        """
+        with open(file_path, "r", encoding=encoding, errors=errors) as file_handle:
+            text = file_handle.read()
+
+        if clean_non_alphanumeric:
+            # Cleaning works per line (it also removes the line endings),
+            # so keep the line boundaries stem_file_lines() would see:
+            # file iteration breaks on '\n' only, unlike str.splitlines(),
+            # which also breaks on form feeds and Unicode line separators
+            stemmed_text = "".join(
+                self.stem_document(line, clean_non_alphanumeric=True)
+                for line in io.StringIO(text, newline="\n")
+            )
+        else:
+            # Words never span lines, so one pass over the whole text is
+            # the same as stemming it line by line
+            stemmed_text = self.stem_document(text)
+
+        with open(output_file, "w", encoding=encoding) as output_handle:
+            return output_handle.write(stemmed_text)
+
+    def stem_corpus(
+        self, documents, workers=None, clean_non_alphanumeric=False, batch_size=64
+    ):
+        """
+        Generator that stems a corpus of documents in worker processes.
+
+        Each document is stemmed as by stem_document(), but batches of
+        documents are spread over a process pool (see
+        _stem_lines_parallel()), so large corpora use every core instead
+        of one. Documents are read lazily and yielded in input order.
+        Workers stem with a copy of this stemmer, customizations
+        included, so the output does not depend on workers.
+
+        Args:
+        documents: Iterable of document strings (e.g. a generator).
+        workers (int, optional): Number of worker processes. Default is
+                                None (os.cpu_count()); 1 stems in this
+                                process without a pool.
+        clean_non_alphanumeric (bool): Passed to stem_document().
+                                     Default is False.
+        batch_size (int): Number of documents sent to a worker at a time.
+                        Default is 64.
+
+        Yields:
+        str: The stemmed documents, in the same order as the input.
+
+        Example:
+        >>> stemmer = PorterVanillaPyStemmer()
+        >>> list(stemmer.stem_corpus(["The dogs ran", "Flies flying"], workers=2))
+        ['the dog ran', 'fli fly']
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers <= 1:
+            for document in documents:
+                yield self.stem_document(
+                    document, clean_non_alphanumeric=clean_non_alphanumeric
+                )
+            return
+
+        yield from self._stem_lines_parallel(
+            documents, workers, clean_non_alphanumeric, batch_size
+        )
+
+    def _worker_settings(self) -> bytes:
+        """
+        Return this stemmer pickled, for worker processes to rebuild it.
+
+        The pickle carries everything __getstate__() does (settings, mode,
+        word_pattern and special-word tables), so a worker stems exactly
+        as this instance would; only the cache starts empty.
+        """
+        return pickle.dumps(self)
+
+    def _stem_lines_parallel(
+        self, lines, workers, clean_non_alphanumeric=False, batch_size=1000
+    ):
+        """
+        Stem lines in worker processes, yielding results in input order.
+
+        Lines are read lazily in batches of batch_size and each batch is
+        stemmed by _stem_lines_in_worker() in a ProcessPoolExecutor, which
+        sidesteps the GIL for this CPU-bound work. At most two batches per
+        worker are in flight, so memory stays bounded on large files.
 
-        # Open file with specified encoding and error handling
-        try:
-            with open(
-                file_path, "r", encoding=encoding, errors=errors, buffering=8192
-            ) as file_handle:
+        Worker processes rebuild this stemmer from its pickle (see
+        _worker_settings()), including a custom word_pattern and
+        special-word tables, so the output matches serial stemming.
 
-                # Process file line by line
-                for line_number, line in enumerate(file_handle, 1):
-                    try:
-                        # Stem the line and yield result
-                        # stem_document preserves whitespace and punctuation
-                        yield self.stem_document(
-                            line, clean_non_alphanumeric=clean_non_alphanumeric
-                        )
-
-                    except Exception as e:
-                        # Wrap any stemming errors with line information
-                        raise RuntimeError(
-                            f"Error stemming line {line_number} in {file_path}: {e}"
-                        ) from e
+        Args:
+        lines: Iterable of lines (e.g. an open text file) or other texts
+              to stem with stem_document().
+        workers (int): Number of worker processes.
+        clean_non_alphanumeric (bool): Passed to stem_document().
+        batch_size (int): Number of lines sent to a worker at a time.
 
-        except UnicodeDecodeError as e:
-            # Enhance error message with file information
-            raise UnicodeDecodeError(
-                e.encoding, e.object, e.start, e.end, f"{e.reason} in file: {file_path}"
-            )
+        Yields:
+        str: Stemmed lines, in the same order as the input lines.
+        """
+        settings = self._worker_settings()
+        lines = iter(lines)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending_batches = deque()
+            while True:
+                batch = list(islice(lines, batch_size))
+                if not batch:
+                    break
+                pending_batches.append(
+                    executor.submit(
+                        _stem_lines_in_worker, settings, batch, clean_non_alphanumeric
+                    )
+                )
+                # Keep the pool busy without reading the whole input ahead
+                if len(pending_batches) >= workers * 2:
+                    yield from pending_batches.popleft().result()
 
-        except IOError as e:
-            # Re-raise with more context
-            raise IOError(f"Error reading file {file_path}: {e}") from e
+            while pending_batches:
+                yield from pending_batches.popleft().result()
 
     def stem_file_wrapper(
         self,
@@ -2913,6 +3886,7 @@ class PorterVanillaPyStemmer:
         output_file=None,
         show_progress=False,
         clean_non_alphanumeric=False,  # ADD THIS PARAMETER
+        workers=None,
     ):
         """
         Process a text file and output the stemmed version.
@@ -2951,6 +3925,10 @@ class PorterVanillaPyStemmer:
 
                                      Useful for creating searchable text indices
                                      or when punctuation should be ignored.
+        workers (int, optional): Number of worker processes to stem with.
+                            Default is None (single process). Worth using
+                            for large files on multi-core machines; output
+                            order is unchanged.
 
         Returns:
         None: This function operates via side effects (writing output).
@@ -3017,20 +3995,24 @@ class PorterVanillaPyStemmer:
                 )
                 sys.exit(1)
 
-            # Check if we can write to the output location
-            try:
-                # Try to open for writing (but don't write anything yet)
-                with open(output_file, "w", encoding="utf-8") as _:
-                    pass
-            except PermissionError:
+            # Check if we can write to the output location. This does not
+            # open the file: an existing output is only truncated once
+            # processing actually starts, and any error the real open()
+            # raises is still reported by the handlers below.
+            if os.path.isdir(output_file):
                 print(
-                    f"Error: Cannot write to '{output_file}'. Permission denied.",
+                    f"Error: Cannot create output file '{output_file}': "
+                    "it is a directory.",
                     file=sys.stderr,
                 )
                 sys.exit(1)
-            except Exception as e:
+            if os.path.exists(output_file):
+                writable = os.access(output_file, os.W_OK)
+            else:
+                writable = os.access(output_dir or ".", os.W_OK)
+            if not writable:
                 print(
-                    f"Error: Cannot create output file '{output_file}': {e}",
+                    f"Error: Cannot write to '{output_file}'. Permission denied.",
                     file=sys.stderr,
                 )
                 sys.exit(1)
@@ -3041,6 +4023,8 @@ class PorterVanillaPyStemmer:
             print("(Case preservation enabled)", file=sys.stderr)
         if clean_non_alphanumeric:  # ADD THIS
             print("(Non-alphanumeric cleaning enabled)", file=sys.stderr)
+        if workers is not None and workers > 1:
+            print(f"(Stemming with {workers} worker processes)", file=sys.stderr)
         print(f"Input file: {filename} ({file_size:,} bytes)", file=sys.stderr)
         if output_file:
             print(f"Output file: {output_file}", file=sys.stderr)
@@ -3054,10 +4038,20 @@ class PorterVanillaPyStemmer:
         last_progress_update = 0
         output_handle = None
 
+        # Stemmed lines not yet written, and the output's write method
+        pending_output = []
+        pending_size = 0
+        write_output = None
+
         try:
             # Open output file if specified, with buffering for efficiency
             if output_file:
                 output_handle = open(output_file, "w", encoding="utf-8", buffering=8192)
+                write_output = output_handle.write
+            else:
+                # Write to stdout without adding extra newline
+                # (stemmed_line already includes original line endings)
+                write_output = sys.stdout.write
 
             # Use the stem_file_lines generator to process the file
             # This provides memory-efficient line-by-line processing
@@ -3067,23 +4061,26 @@ class PorterVanillaPyStemmer:
                     encoding="utf-8",
                     errors="strict",
                     clean_non_alphanumeric=clean_non_alphanumeric,
+                    workers=workers,
                 ),
                 start=1,
             ):
                 try:
                     # Update progress tracking
                     # Note: We estimate bytes since we can't easily get original line size from generator
-                    bytes_processed += len(stemmed_line.encode("utf-8"))
+                    # (characters, not encoded bytes: exact for ASCII text, and it
+                    # avoids encoding every line a second time just to count it)
+                    bytes_processed += len(stemmed_line)
                     lines_processed += 1
 
-                    # Output the stemmed line
-                    if output_file:
-                        output_handle.write(stemmed_line)
-                    else:
-                        # Write to stdout without adding extra newline
-                        # (stemmed_line already includes original line endings)
-                        sys.stdout.write(stemmed_line)
-                        sys.stdout.flush()
+                    # Output the stemmed line, in batches of about
+                    # _WRITE_BATCH_SIZE characters per write call
+                    pending_output.append(stemmed_line)
+                    pending_size += len(stemmed_line)
+                    if pending_size >= self._WRITE_BATCH_SIZE:
+                        write_output("".join(pending_output))
+                        pending_output.clear()
+                        pending_size = 0
 
                     # Show progress for large files (update every MB or 1000 lines)
                     if (
@@ -3116,6 +4113,15 @@ class PorterVanillaPyStemmer:
                     # Attempt to continue with next line
                     continue
 
+            # Write the last partial batch
+            write_output("".join(pending_output))
+            pending_output.clear()
+            if output_file:
+                # Flush before the output size is read below
+                output_handle.flush()
+            else:
+                sys.stdout.flush()
+
             # Clear progress line if it was shown
             if show_progress and file_size > 1024 * 1024:
                 print("\r" + " " * 60 + "\r", end="", file=sys.stderr)
@@ -3187,6 +4193,15 @@ class PorterVanillaPyStemmer:
             sys.exit(1)
 
         finally:
+            # Keep the lines stemmed before an error or interruption
+            if pending_output and write_output is not None:
+                try:
+                    write_output("".join(pending_output))
+                    if not output_file:
+                        sys.stdout.flush()
+                except Exception:
+                    pass
+
             # Ensure output file is closed even if errors occur
             if output_handle:
                 try:
@@ -3221,6 +4236,160 @@ class PorterVanillaPyStemmer:
     ######################################
 
 
+# Process-wide stemmers and memo for the module-level stem() function.
+# A default-configured stem depends only on the word and the mode, so
+# every caller in the process can share one cache per mode, and the
+# cache can be saved with dump_cache() and restored with load_cache().
+# The memo is unbounded: it grows with the vocabulary seen.
+_MODE_STEMMERS = {}
+_STEM_CACHE = {}
+
+
+def stem(word: str, mode: str = "ORIGINAL") -> str:
+    """
+    Stem a word with a shared, process-wide cache.
+
+    Equivalent to PorterVanillaPyStemmer(mode=mode).stem_word(word) with
+    the default options (lowercase output, original word returned on
+    error), but one stemmer and one cache per mode are shared by all
+    callers in the process.
+
+    Args:
+        word (str): The word to stem.
+        mode (str): "ORIGINAL" (default) or "NLTK_EXTENSIONS".
+
+    Returns:
+        str: The stemmed word.
+
+    Example:
+        >>> stem("running")
+        'run'
+        >>> stem("dies", mode="NLTK_EXTENSIONS")
+        'die'
+    """
+    mode_cache = _STEM_CACHE.get(mode)
+    if mode_cache is None:
+        mode_cache = _STEM_CACHE[mode] = {}
+
+    stemmed_word = mode_cache.get(word)
+    if stemmed_word is None:
+        stemmer = _MODE_STEMMERS.get(mode)
+        if stemmer is None:
+            stemmer = _MODE_STEMMERS[mode] = PorterVanillaPyStemmer(mode=mode)
+        stemmed_word = mode_cache[word] = stemmer.stem_word(word)
+
+    return stemmed_word
+
+
+# Per-process stemmer for the _stem_*_in_worker() functions, created on first use in
+# each worker process (and rebuilt if a batch arrives from another stemmer)
+_WORKER_STEMMER = None
+_WORKER_SETTINGS = None
+
+
+def _stem_lines_in_worker(settings, lines, clean_non_alphanumeric):
+    """
+    Stem a batch of lines inside a worker process.
+
+    Module-level so ProcessPoolExecutor can pickle it by reference.
+
+    Args:
+        settings (bytes): The pickled stemmer that dispatched the batch
+          (see PorterVanillaPyStemmer._worker_settings()).
+        lines (list): The lines to stem.
+        clean_non_alphanumeric (bool): Passed to stem_document().
+
+    Returns:
+        list: The stemmed lines, in order.
+    """
+    stemmer = _get_worker_stemmer(settings)
+    return [
+        stemmer.stem_document(line, clean_non_alphanumeric=clean_non_alphanumeric)
+        for line in lines
+    ]
+
+
+def _stem_tokens_in_worker(settings, tokens):
+    """
+    Stem a chunk of distinct tokens inside a worker process.
+
+    Module-level so ProcessPoolExecutor can pickle it by reference.
+
+    Args:
+        settings (bytes): The pickled stemmer that dispatched the chunk
+          (see PorterVanillaPyStemmer._worker_settings()).
+        tokens (list): The tokens to stem.
+
+    Returns:
+        list: The stems, in the order of tokens.
+    """
+    return _get_worker_stemmer(settings).stem_tokens_batch(tokens)
+
+
+def _get_worker_stemmer(settings):
+    """
+    Return this worker process's stemmer, unpickling settings on first
+    use (or when a batch arrives from a different stemmer).
+    """
+    global _WORKER_STEMMER, _WORKER_SETTINGS
+
+    if _WORKER_STEMMER is None or _WORKER_SETTINGS != settings:
+        _WORKER_STEMMER = pickle.loads(settings)
+        _WORKER_SETTINGS = settings
+    return _WORKER_STEMMER
+
+
+def dump_cache(file_path: str) -> int:
+    """
+    Save the shared stem() cache to a JSON file.
+
+    The file maps each mode to a {word: stem} object, so a later process
+    can warm its cache with load_cache() instead of re-stemming its
+    vocabulary.
+
+    Args:
+        file_path (str): Path of the JSON file to write (overwritten).
+
+    Returns:
+        int: The number of cached entries written.
+    """
+    with open(file_path, "w", encoding="utf-8") as file_handle:
+        json.dump(_STEM_CACHE, file_handle, ensure_ascii=False)
+
+    return sum(len(mode_cache) for mode_cache in _STEM_CACHE.values())
+
+
+def load_cache(file_path: str) -> int:
+    """
+    Merge stems saved by dump_cache() into the shared stem() cache.
+
+    JSON is used rather than pickle so loading a cache file can never
+    execute code.
+
+    Args:
+        file_path (str): Path of a JSON file written by dump_cache().
+
+    Returns:
+        int: The number of entries loaded.
+
+    Raises:
+        ValueError: If the file does not contain a cache written by
+          dump_cache().
+    """
+    with open(file_path, "r", encoding="utf-8") as file_handle:
+        saved_cache = json.load(file_handle)
+
+    if not isinstance(saved_cache, dict) or not all(
+        isinstance(mode_cache, dict) for mode_cache in saved_cache.values()
+    ):
+        raise ValueError(f"Not a stem cache file: {file_path}")
+
+    for mode, mode_cache in saved_cache.items():
+        _STEM_CACHE.setdefault(mode, {}).update(mode_cache)
+
+    return sum(len(mode_cache) for mode_cache in saved_cache.values())
+
+
 def run_comprehensive_tests():
     """
     Run comprehensive tests of the Porter Stemmer implementation.
@@ -3236,15 +4405,15 @@ def run_comprehensive_tests():
     print()
 
     # Run tests for both modes
-    original_passed = test_original_mode()
+    original_passed = _run_with_buffered_output(test_original_mode)
     print("\n" + "=" * 70 + "\n")
-    nltk_passed = test_nltk_extensions_mode()
+    nltk_passed = _run_with_buffered_output(test_nltk_extensions_mode)
     print("\n" + "=" * 70 + "\n")
-    error_handling_passed = test_error_handling()
+    error_handling_passed = _run_with_buffered_output(test_error_handling)
     print("\n" + "=" * 70 + "\n")
-    misc_features_passed = test_miscellaneous_features()
+    misc_features_passed = _run_with_buffered_output(test_miscellaneous_features)
     print("\n" + "=" * 70 + "\n")
-    alphanumeric_cleaning_passed = test_alphanumeric_cleaning()
+    alphanumeric_cleaning_passed = _run_with_buffered_output(test_alphanumeric_cleaning)
 
     # Summary
     all_passed = (
@@ -3272,6 +4441,104 @@ def run_comprehensive_tests():
     return all_passed
 
 
+def _run_with_buffered_output(function, *args, **kwargs):
+    """
+    Call function, writing everything it prints in a single write.
+
+    Used for the test groups and the CLI demo output: their print()
+    calls go to an in-memory buffer instead of one (possibly
+    line-buffered) stdout write each; the output is written out even
+    if function raises.
+
+    Args:
+        function: The function to call (e.g. one of the test_*()
+          functions).
+        *args, **kwargs: Passed to function.
+
+    Returns:
+        The function's result.
+    """
+    report = io.StringIO()
+    try:
+        with redirect_stdout(report):
+            return function(*args, **kwargs)
+    finally:
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
+
+
+# Fixtures of test_alphanumeric_cleaning(), built once at import as
+# tuples rather than rebuilt as lists on every run of the test.
+
+# _clean_non_alphanumeric_characters_and_normalize_spaces() cases
+_CLEANING_TEST_CASES = (
+    # (input, expected_output, description)
+    ("Hello, world!", "Hello world", "Basic punctuation removal"),
+    ("user@email.com", "user email com", "Email address cleaning"),
+    ("Phone: (555) 123-4567", "Phone 555 123 4567", "Phone number cleaning"),
+    ("don't", "don't", "Apostrophe handling"),
+    ("pre-process", "pre process", "Hyphen handling"),
+    ("Hello\n\tWorld", "Hello World", "Whitespace normalization"),
+    (
+        "Multiple   spaces    here",
+        "Multiple spaces here",
+        "Multiple space normalization",
+    ),
+    ("  Leading and trailing  ", "Leading and trailing", "Trim spaces"),
+    ("Special@#$%^&*()chars!", "Special chars", "Special character removal"),
+    ("Mix123Numbers456", "Mix123Numbers456", "Alphanumeric preserved"),
+    ("", "", "Empty string handling"),
+    ("!!!", "", "Only punctuation becomes empty"),
+    ("one\ntwo\tthree\rfour", "one two three four", "Various whitespace chars"),
+    ("UTF-8: café résumé", "UTF 8 café résumé", "Non-ASCII character handling"),
+)
+
+# stem_document(..., clean_non_alphanumeric=True) cases
+_CLEANING_DOCUMENT_TEST_CASES = (
+    # (input, expected_output, description)
+    (
+        "The user's e-mail is: john@example.com!",
+        "the user's e mail is john exampl com",
+        "Email and punctuation in document",
+    ),
+    (
+        "Running, flying & swimming (quickly)!",
+        "run fly swim quickli",
+        "Multiple words with punctuation",
+    ),
+    (
+        "Don't forget: pre-process the data!",
+        "don't forget pre process the data",
+        "Contractions and hyphens",
+    ),
+    (
+        "Phone: (555) 123-4567\nAddress: 123 Main St.",
+        "phone 555 123 4567 address 123 main st",
+        "Multi-line with numbers",
+    ),
+    (
+        "Testing   multiple    spaces   here!",
+        "test multipl space here",
+        "Multiple spaces with stemming",
+    ),
+    (
+        "UPPERCASE, lowercase, MiXeD-CaSe!",
+        "uppercas lowercas mix case",
+        "Case handling with cleaning",
+    ),
+)
+
+# Unicode character preservation cases
+_CLEANING_UNICODE_TEST_CASES = (
+    # (input, expected, description)
+    ("Café résumé naïve", "café résumé naïv", "French accented characters"),
+    ("Zürich München", "zürich münchen", "German umlauts"),
+    ("Москва Санкт-Петербург", "москва санкт петербург", "Cyrillic script"),
+    ("北京 上海", "北京 上海", "Chinese characters"),
+    ("Hello café-society!", "hello café societi", "Mixed ASCII and Unicode"),
+)
+
+
 def test_alphanumeric_cleaning():
     """
     Test the non-alphanumeric character cleaning and space normalization feature.
@@ -3292,29 +4559,8 @@ def test_alphanumeric_cleaning():
     print("\nTesting _clean_non_alphanumeric_characters_and_normalize_spaces:")
     print("-" * 50)
 
-    cleaning_test_cases = [
-        # (input, expected_output, description)
-        ("Hello, world!", "Hello world", "Basic punctuation removal"),
-        ("user@email.com", "user email com", "Email address cleaning"),
-        ("Phone: (555) 123-4567", "Phone 555 123 4567", "Phone number cleaning"),
-        ("don't", "don't", "Apostrophe handling"),
-        ("pre-process", "pre process", "Hyphen handling"),
-        ("Hello\n\tWorld", "Hello World", "Whitespace normalization"),
-        (
-            "Multiple   spaces    here",
-            "Multiple spaces here",
-            "Multiple space normalization",
-        ),
-        ("  Leading and trailing  ", "Leading and trailing", "Trim spaces"),
-        ("Special@#$%^&*()chars!", "Special chars", "Special character removal"),
-        ("Mix123Numbers456", "Mix123Numbers456", "Alphanumeric preserved"),
-        ("", "", "Empty string handling"),
-        ("!!!", "", "Only punctuation becomes empty"),
-        ("one\ntwo\tthree\rfour", "one two three four", "Various whitespace chars"),
-        ("UTF-8: café résumé", "UTF 8 café résumé", "Non-ASCII character handling"),
-    ]
 
-    for input_text, expected, description in cleaning_test_cases:
+    for input_text, expected, description in _CLEANING_TEST_CASES:
         try:
             actual = stemmer._clean_non_alphanumeric_characters_and_normalize_spaces(
                 input_text
@@ -3334,41 +4580,8 @@ def test_alphanumeric_cleaning():
     print("\n\nTesting stem_document with clean_non_alphanumeric=True:")
     print("-" * 50)
 
-    document_test_cases = [
-        # (input, expected_output, description)
-        (
-            "The user's e-mail is: john@example.com!",
-            "the user's e mail is john exampl com",
-            "Email and punctuation in document",
-        ),
-        (
-            "Running, flying & swimming (quickly)!",
-            "run fly swim quickli",
-            "Multiple words with punctuation",
-        ),
-        (
-            "Don't forget: pre-process the data!",
-            "don't forget pre process the data",
-            "Contractions and hyphens",
-        ),
-        (
-            "Phone: (555) 123-4567\nAddress: 123 Main St.",
-            "phone 555 123 4567 address 123 main st",
-            "Multi-line with numbers",
-        ),
-        (
-            "Testing   multiple    spaces   here!",
-            "test multipl space here",
-            "Multiple spaces with stemming",
-        ),
-        (
-            "UPPERCASE, lowercase, MiXeD-CaSe!",
-            "uppercas lowercas mix case",
-            "Case handling with cleaning",
-        ),
-    ]
 
-    for input_text, expected, description in document_test_cases:
+    for input_text, expected, description in _CLEANING_DOCUMENT_TEST_CASES:
         try:
             actual = stemmer.stem_document(input_text, clean_non_alphanumeric=True)
             if actual == expected:
@@ -3415,19 +4628,6 @@ def test_alphanumeric_cleaning():
     print("\n\nTesting edge cases:")
     print("-" * 50)
 
-    # Test with only non-alphanumeric characters
-    only_punct = "!!!@@@###$$$"
-    result = stemmer.stem_document(only_punct, clean_non_alphanumeric=True)
-    if result == "":
-        print("✓ Only punctuation returns empty string")
-    else:
-        print(f"✗ Only punctuation should return empty string, got: '{result}'")
-        passed = False
-
-    # Test edge cases
-    print("\n\nTesting edge cases:")
-    print("-" * 50)
-
     # Test with only non-alphanumeric characters
     only_punct = "!!!@@@###$$$"
     result = stemmer.stem_document(only_punct, clean_non_alphanumeric=True)
@@ -3439,16 +4639,8 @@ def test_alphanumeric_cleaning():
 
     # Test with Unicode characters - now with proper verification
     print("\nTesting Unicode character preservation:")
-    unicode_test_cases = [
-        # (input, expected, description)
-        ("Café résumé naïve", "café résumé naïv", "French accented characters"),
-        ("Zürich München", "zürich münchen", "German umlauts"),
-        ("Москва Санкт-Петербург", "москва санкт петербург", "Cyrillic script"),
-        ("北京 上海", "北京 上海", "Chinese characters"),
-        ("Hello café-society!", "hello café societi", "Mixed ASCII and Unicode"),
-    ]
 
-    for input_text, expected, description in unicode_test_cases:
+    for input_text, expected, description in _CLEANING_UNICODE_TEST_CASES:
         result = stemmer.stem_document(input_text, clean_non_alphanumeric=True)
         if result == expected:
             print(f"✓ {description}: '{input_text}' -> '{result}'")
@@ -3823,6 +5015,434 @@ def test_miscellaneous_features():
         print(f"  Actual:   {actual}")
         passed = False
 
+    # Test stem_tokens_batch against stem_tokens
+    batch_tokens = ["Running", "flies", "running", "", "Flies", "happily"]
+    actual = stemmer.stem_tokens_batch(batch_tokens)
+    expected = stemmer.stem_tokens(batch_tokens)
+    if actual == expected:
+        print("✓ stem_tokens_batch() matches stem_tokens()")
+    else:
+        print(f"✗ stem_tokens_batch() failed")
+        print(f"  Expected: {expected}")
+        print(f"  Actual:   {actual}")
+        passed = False
+
+    # A failing token is reported at its first index, as in stem_tokens()
+    class FailingStemmer(PorterVanillaPyStemmer):
+        __slots__ = ()
+
+        def _stem_lowercase_word(self, word):
+            if word.startswith("bad"):
+                raise ValueError(f"cannot stem '{word}'")
+            return super()._stem_lowercase_word(word)
+
+    strict_stemmer = FailingStemmer(preserve_original_on_error=False)
+    failing_tokens = ["ok", "badone", "running", "badtwo", "badthree", "badone"]
+    try:
+        strict_stemmer.stem_tokens_batch(failing_tokens)
+        print("✗ stem_tokens_batch() accepted invalid tokens")
+        passed = False
+    except RuntimeError as e:
+        if "index 1:" in str(e):
+            print("✓ stem_tokens_batch() reports the first failing index")
+        else:
+            print(f"✗ stem_tokens_batch() reported the wrong token: {e}")
+            passed = False
+
+    # Tokens with punctuation or digits are passed through, lowercased
+    # when to_lowercase is set, rather than rejected
+    print("\nTesting non-alphabetic tokens:")
+    strict_stemmer = PorterVanillaPyStemmer(preserve_original_on_error=False)
+    for token_stemmer, token, expected in [
+        (stemmer, "Don't", "don't"),
+        (stemmer, "HELLO!", "hello!"),
+        (stemmer, "Route66", "route66"),
+        (stemmer, "İstanbul", "İstanbul".lower()),
+        (strict_stemmer, "Running's", "running's"),
+        (case_stemmer, "HELLO!", "HELLO!"),
+    ]:
+        actual = token_stemmer.stem_word(token)
+        if actual == expected:
+            print(f"✓ {token} -> {actual}")
+        else:
+            print(f"✗ {token} -> {actual}, expected {expected}")
+            passed = False
+    actual = stemmer.stem_tokens_batch(["Don't", "Runners", "HELLO!"])
+    if actual == ["don't", "runner", "hello!"]:
+        print("✓ stem_tokens_batch() lowercases non-alphabetic tokens")
+    else:
+        print(f"✗ stem_tokens_batch() gave {actual}")
+        passed = False
+
+    # Test stem_many on a generator with repeated words
+    many_words = ["running", "Flies", "running", "happily", "Flies"]
+    actual = stemmer.stem_many(word for word in many_words)
+    expected = [stemmer.stem_word(word) for word in many_words]
+    if actual == expected:
+        print("✓ stem_many() matches stem_word() on an iterable")
+    else:
+        print(f"✗ stem_many() failed")
+        print(f"  Expected: {expected}")
+        print(f"  Actual:   {actual}")
+        passed = False
+
+    # Test memoization cache
+    print("\nTesting stem cache:")
+    cache_stemmer = PorterVanillaPyStemmer()
+    first = cache_stemmer.stem_word("running")
+    second = cache_stemmer.stem_word("Running")
+    info = cache_stemmer.cache_info()
+
+    if first == second == "run" and info.hits == 1 and info.misses == 1:
+        print("✓ Repeated word is served from the cache")
+    else:
+        print(f"✗ Cache lookup failed: {first}, {second}, {info}")
+        passed = False
+
+    cache_stemmer.cache_clear()
+    if cache_stemmer.cache_info().currsize == 0:
+        print("✓ cache_clear() empties the cache")
+    else:
+        print("✗ cache_clear() did not empty the cache")
+        passed = False
+
+    small_cache_stemmer = PorterVanillaPyStemmer(cache_size=2)
+    for cache_word in ["running", "jumping", "flies", "running"]:
+        small_cache_stemmer.stem_word(cache_word)
+    small_info = small_cache_stemmer.cache_info()
+    if small_info.maxsize == 2 and small_info.currsize == 2 and small_info.hits == 0:
+        print("✓ cache_size bounds the cache and evicts least recently used")
+    else:
+        print(f"✗ cache_size not honoured: {small_info}")
+        passed = False
+
+    # Special-word tables: a new table takes effect at once, and an
+    # in-place edit takes effect for every casing after cache_clear()
+    print("\nTesting special-word table updates:")
+    table_stemmer = PorterVanillaPyStemmer(to_lowercase=False)
+    table_stemmer.stem_word("Flying")
+    table_stemmer.original_special_words = {"running": "zzz"}
+    if table_stemmer.stem_word("running") == "zzz":
+        print("✓ Assigning a special-word table takes effect")
+    else:
+        print("✗ Assigned special-word table was ignored")
+        passed = False
+    table_stemmer.original_special_words["flying"] = "zzz"
+    table_stemmer.cache_clear()
+    if table_stemmer.stem_word("flying") == table_stemmer.stem_word("Flying").lower():
+        print("✓ In-place table edit applies to every casing after cache_clear()")
+    else:
+        print("✗ In-place table edit gives different stems by casing")
+        passed = False
+
+    # A custom word_pattern need not capture the word in a single group
+    print("\nTesting custom word patterns:")
+    for custom_pattern in [r"\b[a-zA-Z]+\b", r"\b([a-zA-Z])([a-zA-Z]*)\b"]:
+        pattern_stemmer = PorterVanillaPyStemmer()
+        pattern_stemmer.word_pattern = re.compile(custom_pattern)
+        actual = pattern_stemmer.stem_document("The runners were running")
+        batch = pattern_stemmer.stem_document_batch(["The runners", "were running"])
+        if actual == "the runner were run" and batch == ["the runner", "were run"]:
+            print(f"✓ word_pattern {custom_pattern} stems every word")
+        else:
+            print(f"✗ word_pattern {custom_pattern} gave {actual!r}, {batch!r}")
+            passed = False
+
+    # Pickled and copied stemmers get their own cache, bound to the copy
+    print("\nTesting pickle and copy round trips:")
+    source_stemmer = PorterVanillaPyStemmer(to_lowercase=False, cache_size=100)
+    source_stemmer.stem_word("pies")
+    for copy_name, copy_function in [
+        ("pickle", lambda s: pickle.loads(pickle.dumps(s))),
+        ("copy.copy", copy.copy),
+        ("copy.deepcopy", copy.deepcopy),
+    ]:
+        copied_stemmer = copy_function(source_stemmer)
+        copied_stemmer.mode = "NLTK_EXTENSIONS"
+        if (
+            copied_stemmer.stem_word("Pies") == "Pie"
+            and copied_stemmer.cache_size == 100
+            and source_stemmer.mode == "ORIGINAL"
+            and source_stemmer.cache_info().currsize == 1
+            and source_stemmer.stem_word("pies") == "pi"
+        ):
+            print(f"✓ {copy_name} gives an independent stemmer")
+        else:
+            print(f"✗ {copy_name} copy is still tied to the original stemmer")
+            passed = False
+
+    print("\nTesting consonant/vowel pattern:")
+    pattern_stemmer = PorterVanillaPyStemmer()
+    for pattern_word, expected_pattern in [
+        ("tree", "ccvv"),
+        ("happy", "cvccv"),
+        ("yellow", "cvccvc"),
+        ("boyish", "cvcvcc"),
+        ("syzygy", "cvcvcv"),
+    ]:
+        actual_pattern = pattern_stemmer._consonant_vowel_pattern(pattern_word)
+        if actual_pattern == expected_pattern:
+            print(f"✓ '{pattern_word}' -> '{actual_pattern}'")
+        else:
+            print(
+                f"✗ '{pattern_word}' -> '{actual_pattern}' (expected '{expected_pattern}')"
+            )
+            passed = False
+
+    # _is_consonant() must agree with the pattern, including runs of 'y'
+    for pattern_word in ["syzygy", "y", "yy", "yyy", "ayyy", "sayyy"]:
+        expected_pattern = pattern_stemmer._consonant_vowel_pattern(pattern_word)
+        actual_pattern = "".join(
+            "c" if pattern_stemmer._is_consonant(pattern_word, index) else "v"
+            for index in range(len(pattern_word))
+        )
+        if actual_pattern == expected_pattern:
+            print(f"✓ _is_consonant agrees with pattern for '{pattern_word}'")
+        else:
+            print(
+                f"✗ _is_consonant gives '{actual_pattern}' for '{pattern_word}' "
+                f"(expected '{expected_pattern}')"
+            )
+            passed = False
+
+    # The pattern threaded through the steps must always match the
+    # pattern of the (shortened or extended) word each step returns
+    steps = [
+        pattern_stemmer._step1a,
+        pattern_stemmer._step1b,
+        pattern_stemmer._step1c,
+        pattern_stemmer._step2,
+        pattern_stemmer._step3,
+        pattern_stemmer._step4,
+        pattern_stemmer._step5a,
+        pattern_stemmer._step5b,
+    ]
+    for pattern_word in ["relational", "hopping", "happy", "controlling", "agreed"]:
+        step_word = pattern_word
+        step_pattern = pattern_stemmer._consonant_vowel_pattern(step_word)
+        for step in steps:
+            step_word, step_pattern = step(step_word, step_pattern)
+            if step_pattern != pattern_stemmer._consonant_vowel_pattern(step_word):
+                print(f"✗ Pattern out of sync for '{pattern_word}' at {step.__name__}")
+                passed = False
+                break
+        else:
+            print(f"✓ Pattern stays in sync through all steps for '{pattern_word}'")
+
+    print("\nTesting fixed-point shortcut words:")
+    changed_words = []
+    for fixed_mode in ["ORIGINAL", "NLTK_EXTENSIONS"]:
+        fixed_stemmer = PorterVanillaPyStemmer(mode=fixed_mode)
+        for fixed_word in sorted(_FIXED_POINT_WORDS):
+            # Run the steps directly, bypassing the shortcut
+            step_word = fixed_word
+            step_pattern = fixed_stemmer._consonant_vowel_pattern(fixed_word)
+            for step in [
+                fixed_stemmer._step1a,
+                fixed_stemmer._step1b,
+                fixed_stemmer._step1c,
+                fixed_stemmer._step2,
+                fixed_stemmer._step3,
+                fixed_stemmer._step4,
+                fixed_stemmer._step5a,
+                fixed_stemmer._step5b,
+            ]:
+                step_word, step_pattern = step(step_word, step_pattern)
+            if step_word != fixed_word:
+                changed_words.append((fixed_mode, fixed_word, step_word))
+
+    if not changed_words:
+        print(f"✓ All {len(_FIXED_POINT_WORDS)} shortcut words are fixed points")
+    else:
+        print(f"✗ Shortcut words changed by the steps: {changed_words}")
+        passed = False
+
+    print("\nTesting shared stem() cache:")
+    if stem("running") == "run" and stem("dies", mode="NLTK_EXTENSIONS") == "die":
+        print("✓ stem() matches PorterVanillaPyStemmer in both modes")
+    else:
+        print("✗ stem() gave unexpected results")
+        passed = False
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_path = os.path.join(cache_dir, "stem_cache.json")
+        dumped_count = dump_cache(cache_path)
+        _STEM_CACHE.clear()
+        loaded_count = load_cache(cache_path)
+
+    if (
+        dumped_count == loaded_count
+        and _STEM_CACHE.get("ORIGINAL", {}).get("running") == "run"
+    ):
+        print(f"✓ dump_cache()/load_cache() round-trip {loaded_count} entries")
+    else:
+        print(f"✗ Cache round-trip failed: {dumped_count} dumped, {loaded_count} loaded")
+        passed = False
+
+    print("\nTesting mode switch on an existing stemmer:")
+    switch_stemmer = PorterVanillaPyStemmer()
+    before_switch = switch_stemmer.stem_word("dies")
+    switch_stemmer.mode = "NLTK_EXTENSIONS"
+    after_switch = switch_stemmer.stem_word("dies")
+    if before_switch == "di" and after_switch == "die":
+        print("✓ Changing mode applies the new mode's rules")
+    else:
+        print(f"✗ Mode switch gave '{before_switch}' then '{after_switch}'")
+        passed = False
+
+    print("\nTesting parallel file stemming:")
+    file_stemmer = PorterVanillaPyStemmer()
+    with tempfile.TemporaryDirectory() as lines_dir:
+        lines_path = os.path.join(lines_dir, "lines.txt")
+        with open(lines_path, "w", encoding="utf-8") as lines_file:
+            for line_index in range(2500):
+                lines_file.write(f"Line {line_index}: the runners were running happily\n")
+
+        sequential_lines = list(file_stemmer.stem_file_lines(lines_path))
+        parallel_lines = list(file_stemmer.stem_file_lines(lines_path, workers=2))
+
+        bulk_path = os.path.join(lines_dir, "bulk.txt")
+        file_stemmer.stem_file_bulk(lines_path, bulk_path)
+        with open(bulk_path, encoding="utf-8") as bulk_file:
+            bulk_text = bulk_file.read()
+
+        # Form feeds, other separators and CRLF endings must split (or
+        # not split) lines the same way in both methods when cleaning
+        separators_path = os.path.join(lines_dir, "separators.txt")
+        with open(separators_path, "w", encoding="utf-8", newline="") as sep_file:
+            sep_file.write(
+                "running\x0cjumps\nflies cats\r\nhopping\u2028hopped"
+                "\x1cdogs\x85cats\u2029end\rlast\n"
+            )
+        separators_lines = "".join(
+            file_stemmer.stem_file_lines(separators_path, clean_non_alphanumeric=True)
+        )
+        file_stemmer.stem_file_bulk(
+            separators_path, bulk_path, clean_non_alphanumeric=True
+        )
+        with open(bulk_path, encoding="utf-8") as bulk_file:
+            separators_bulk = bulk_file.read()
+
+    if bulk_text == "".join(sequential_lines):
+        print("✓ stem_file_bulk() writes the same text as stem_file_lines()")
+    else:
+        print("✗ stem_file_bulk() differs from stem_file_lines()")
+        passed = False
+
+    if separators_bulk == separators_lines:
+        print("✓ stem_file_bulk() splits cleaned lines like stem_file_lines()")
+    else:
+        print(f"✗ stem_file_bulk() gave {separators_bulk!r}")
+        print(f"  stem_file_lines() gave {separators_lines!r}")
+        passed = False
+
+    if parallel_lines == sequential_lines and len(parallel_lines) == 2500:
+        print("✓ workers=2 yields the same lines in the same order")
+    else:
+        print("✗ Parallel file stemming differs from sequential stemming")
+        passed = False
+
+    # Workers must stem exactly as the dispatching stemmer, customizations
+    # included, so workers only changes the speed
+    custom_stemmer = PorterVanillaPyStemmer()
+    custom_stemmer.original_special_words = {"running": "zzz"}
+    custom_stemmer.word_pattern = re.compile(r"\b[a-z]+\b")
+    with tempfile.TemporaryDirectory() as custom_dir:
+        custom_path = os.path.join(custom_dir, "custom.txt")
+        with open(custom_path, "w", encoding="utf-8") as custom_file:
+            custom_file.write("running fast\nThe Runners\n" * 1500)
+        custom_serial = list(custom_stemmer.stem_file_lines(custom_path))
+        custom_parallel = list(custom_stemmer.stem_file_lines(custom_path, workers=2))
+    if custom_parallel == custom_serial and custom_serial[:2] == [
+        "zzz fast\n",
+        "The Runners\n",
+    ]:
+        print("✓ workers=2 keeps a customized stemmer's settings")
+    else:
+        print("✗ Parallel file stemming lost the stemmer's customizations")
+        passed = False
+
+    corpus = [f"Document {index}: flies were flying by" for index in range(200)]
+    parallel_documents = list(
+        file_stemmer.stem_corpus(iter(corpus), workers=2, batch_size=16)
+    )
+    if parallel_documents == [file_stemmer.stem_document(text) for text in corpus]:
+        print("✓ stem_corpus() matches stem_document() in input order")
+    else:
+        print("✗ stem_corpus() differs from stem_document()")
+        passed = False
+
+    custom_corpus = [f"Document {index}: running fast" for index in range(200)]
+    parallel_custom = list(
+        custom_stemmer.stem_corpus(iter(custom_corpus), workers=2, batch_size=16)
+    )
+    serial_custom = list(custom_stemmer.stem_corpus(custom_corpus, workers=1))
+    if (
+        parallel_custom == serial_custom
+        and parallel_custom[0] == custom_stemmer.stem_document(custom_corpus[0])
+        and parallel_custom[0].endswith("zzz fast")
+    ):
+        print("✓ stem_corpus() keeps a customized stemmer's settings")
+    else:
+        print("✗ Parallel stem_corpus() lost the stemmer's customizations")
+        passed = False
+
+    batch_documents = [
+        "The boys are running quickly!",
+        "",
+        "user@email.com, phone: (555) 123-4567",
+        "Flies\x00flying",
+        "Café résumé naïve",
+    ]
+    # The NUL in the fourth document makes the batch fall back to
+    # per-document stemming; the first three take the joined path
+    batch_matches = True
+    for clean in (False, True):
+        for documents in (batch_documents, batch_documents[:3]):
+            expected_documents = [
+                file_stemmer.stem_document(text, clean_non_alphanumeric=clean)
+                for text in documents
+            ]
+            if (
+                file_stemmer.stem_document_batch(
+                    documents, clean_non_alphanumeric=clean
+                )
+                != expected_documents
+            ):
+                batch_matches = False
+    # A custom word_pattern that matches NUL must not merge documents
+    nul_stemmer = PorterVanillaPyStemmer()
+    nul_stemmer.word_pattern = re.compile(r"\S+")
+    if nul_stemmer.stem_document_batch(["running", "jumps"]) != ["run", "jump"]:
+        batch_matches = False
+    if batch_matches:
+        print("✓ stem_document_batch() matches stem_document() per document")
+    else:
+        print("✗ stem_document_batch() differs from stem_document()")
+        passed = False
+
+    parallel_tokens = [f"flying{chr(97 + index % 26)}" for index in range(3000)]
+    parallel_tokens += ["running", "Flies", "running"]
+    if file_stemmer.stem_tokens_parallel(
+        parallel_tokens, workers=2, chunk_size=8
+    ) == file_stemmer.stem_tokens(parallel_tokens):
+        print("✓ stem_tokens_parallel() matches stem_tokens()")
+    else:
+        print("✗ stem_tokens_parallel() differs from stem_tokens()")
+        passed = False
+
+    custom_tokens = parallel_tokens + ["Running"]
+    custom_stems = custom_stemmer.stem_tokens_parallel(
+        custom_tokens, workers=2, chunk_size=8
+    )
+    if custom_stems == custom_stemmer.stem_tokens(custom_tokens) and (
+        custom_stems[-1] == "zzz"
+    ):
+        print("✓ stem_tokens_parallel() keeps a customized stemmer's settings")
+    else:
+        print("✗ stem_tokens_parallel() lost the stemmer's customizations")
+        passed = False
+
     print(f"\nMiscellaneous Features Summary: {'PASSED' if passed else 'FAILED'}")
     return passed
 
@@ -3929,6 +5549,7 @@ Available options:
 --file FILENAME         Process a text file and output stemmed version
 --preserve-case         Preserve original case (default: convert to lowercase)
 --clean-non-alpha       Remove punctuation and special characters before stemming
+--workers N             Stem --file input in N worker processes
 
 
 Examples:
@@ -3940,6 +5561,7 @@ python porter_stemmer.py --word running flies happy
 python porter_stemmer.py --word Running Flies Happy --preserve-case
 python porter_stemmer.py --file document.txt
 python porter_stemmer.py --file document.txt --preserve-case
+python porter_stemmer.py --file large_document.txt --workers 4
       """
         print(help_text)
 
@@ -4213,13 +5835,18 @@ kept bothering them. Happily, they enjoyed their day anyway!"""
         # Create stemmer instance with appropriate case handling
         stemmer = PorterVanillaPyStemmer(to_lowercase=not preserve_case)
 
-        # Process each word
-        for word in word_list:
-            try:
-                stemmed = stemmer.stem_word(word)
-                print(f"{word:20} -> {stemmed}")
-            except Exception as error:
-                print(f"Error processing '{word}': {error}")
+        def result_lines():
+            """Yield the output line for each word, in order."""
+            for word in word_list:
+                try:
+                    stemmed = stemmer.stem_word(word)
+                    yield f"{word:20} -> {stemmed}"
+                except Exception as error:
+                    yield f"Error processing '{word}': {error}"
+
+        # Process each word, printing all result lines in one call
+        if word_list:
+            print("\n".join(result_lines()))
 
     ###############################
     # Parse command-line arguments
@@ -4245,6 +5872,22 @@ kept bothering them. Happily, they enjoyed their day anyway!"""
     if clean_non_alphanumeric_flag:
         args.remove("--clean-non-alpha")
 
+    # Check for the worker-count option early (used by --file)
+    file_workers = None
+    if "--workers" in args:
+        workers_index = args.index("--workers")
+        workers_value = args[workers_index + 1 : workers_index + 2]
+        if (
+            not workers_value
+            or not workers_value[0].isdecimal()
+            or int(workers_value[0]) < 1
+        ):
+            print("Error: --workers needs a number of worker processes (1 or more)")
+            print("Example: python porter_stemmer.py --file document.txt --workers 4")
+            sys.exit(1)
+        file_workers = int(workers_value[0])
+        del args[workers_index : workers_index + 2]
+
     ####################
     # Process arguments
     ####################
@@ -4261,7 +5904,7 @@ kept bothering them. Happily, they enjoyed their day anyway!"""
 
     # Check for demo request
     elif "--demo" in args:
-        run_live_demo(preserve_case=preserve_case)
+        _run_with_buffered_output(run_live_demo, preserve_case=preserve_case)
         sys.exit(0)
 
     # Check for word processing
@@ -4279,7 +5922,9 @@ kept bothering them. Happily, they enjoyed their day anyway!"""
             sys.exit(1)
 
         # Process the words with case preference
-        stem_words_from_args(words_to_stem, preserve_case=preserve_case)
+        _run_with_buffered_output(
+            stem_words_from_args, words_to_stem, preserve_case=preserve_case
+        )
         sys.exit(0)
 
     # Check for file processing
@@ -4314,23 +5959,10 @@ kept bothering them. Happily, they enjoyed their day anyway!"""
             preserve_case=False,
             output_file="converted.txt",
             clean_non_alphanumeric=clean_non_alphanumeric_flag,
+            workers=file_workers,
         )
         sys.exit(0)
 
-    # # Simple Version
-    # elif '--file' in args:
-    #     file_index = args.index('--file')
-    #     if file_index + 1 >= len(args):
-    #         print("Error: No filename provided")
-    #         sys.exit(1)
-
-    #     filename = args[file_index + 1]
-
-    #     # Create stemmer and process file
-    #     stemmer = PorterVanillaPyStemmer(to_lowercase=not preserve_case)
-    #     stemmer.stem_file_simple(filename, "output.txt")
-    #     print(f"Done. Output written to output.txt")
-
     # Check for test request
     elif "--test" in args:
         # Run comprehensive tests